@@ -11,7 +11,7 @@ This script demonstrates how to use the Phone Agent Framework programmatically.
 from phone_agent.config import Config
 from phone_agent.device_bridge import DeviceBridge
 from phone_agent.integration import AgentIntegration
-from phone_agent.executor import TaskExecutor
+from phone_agent.executor import TaskExecutor, load_trajectory
 from src.mai_naivigation_agent import MAIUINaivigationAgent
 
 
@@ -115,7 +115,6 @@ def example_4_device_actions():
 
 def example_5_trajectory_analysis():
     """Example 5: Analyze saved trajectory."""
-    import json
     from pathlib import Path
     
     print("\n" + "="*60)
@@ -138,16 +137,15 @@ def example_5_trajectory_analysis():
         return
     
     # Load latest trajectory
-    latest_trajectory = task_dirs[0] / "trajectory.json"
+    latest_trajectory = task_dirs[0]
     
-    if not latest_trajectory.exists():
+    if not (latest_trajectory / "summary.json").exists():
         print("No trajectory file found")
         return
     
     print(f"Loading: {latest_trajectory}")
     
-    with open(latest_trajectory, "r") as f:
-        data = json.load(f)
+    data = load_trajectory(latest_trajectory)
     
     print(f"\nTask: {data['instruction']}")
     print(f"Status: {data['status']}")
@@ -161,7 +161,7 @@ def run(instruction, model_url, model_name, device_serial, max_steps, debug, use
         
         # Show trajectory path
         if config.logging.save_trajectory:
-            log_path = Path(config.logging.output_dir) / result.task_id / "trajectory.json"
+            log_path = Path(config.logging.output_dir) / result.task_id
             click.echo(f"\n📝 Trajectory saved: {log_path}")
             click.echo(f"   Replay with: mai-phone replay {log_path}")
         
@@ -351,25 +351,30 @@ def doctor():
 @cli.command()
 @click.argument("trajectory_file", type=click.Path(exists=True))
 def replay(trajectory_file):
-    """Replay a saved trajectory."""
-    import json
+    """Replay a saved trajectory (task log directory or trajectory file)."""
+    from mai_phone_agent.executor import load_trajectory
     
     try:
         click.echo(f"📼 Replaying trajectory: {trajectory_file}\n")
         
-        with open(trajectory_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_trajectory(trajectory_file)
         
-        click.echo(f"Task ID: {data['task_id']}")
-        click.echo(f"Instruction: {data['instruction']}")
-        click.echo(f"Status: {data['status']}")
-        click.echo(f"Total steps: {data['total_steps']}")
-        click.echo(f"Duration: {data['duration_seconds']:.2f}s")
+        click.echo(f"Task ID: {data.get('task_id', 'Unknown')}")
+        click.echo(f"Instruction: {data.get('instruction', 'Unknown')}")
+        if data.get("started_at"):
+            click.echo(f"Started: {data['started_at']}")
+        click.echo(f"Status: {data.get('status', 'incomplete')}")
+        click.echo(f"Total steps: {data.get('total_steps', len(data['trajectory']))}")
+        if "duration_seconds" in data:
+            click.echo(f"Duration: {data['duration_seconds']:.2f}s")
         click.echo("\n" + "="*60)
         
         for step in data['trajectory']:
             click.echo(f"\nStep {step['step_number']}:")
-            click.echo(f"  Timestamp: {step['timestamp']}")
+            if "timestamp_offset_ms" in step:
+                click.echo(f"  Offset: +{step['timestamp_offset_ms'] / 1000:.2f}s")
+            else:
+                click.echo(f"  Timestamp: {step['timestamp']}")
             if step.get('thinking'):
                 click.echo(f"  Thinking: {step['thinking'][:100]}...")
             click.echo(f"  Action: {step['action']}")
@@ -0,0 +1,74 @@
+# Copyright (c) 2025, Alibaba Cloud and its affiliates;
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batched coordinate denormalization for Phone Agent Framework.
+
+Converts many normalized [0, 1] points into clipped pixel coordinates in a
+single call, e.g. for swipe paths or when driving several devices at once.
+The kernel is JIT-compiled with numba when it is installed and falls back to
+vectorized NumPy otherwise.
+"""
+
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is optional
+    numba = None
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _denorm_kernel(coords, scales, out):
+        for i in range(coords.shape[0]):
+            for axis in range(2):
+                value = int(coords[i, axis] * scales[i, axis])
+                out[i, axis] = min(max(value, 0), scales[i, axis] - 1)
+
+else:
+
+    def _denorm_kernel(coords, scales, out):
+        np.clip((coords * scales).astype(np.int32), 0, scales - 1, out=out)
+
+
+def denormalize_batch(
+    coords: Union[np.ndarray, Sequence[Sequence[float]]],
+    scales: Union[np.ndarray, Sequence[Sequence[int]], Tuple[int, int]],
+) -> np.ndarray:
+    """
+    Convert normalized coordinates to pixel coordinates in one batch.
+
+    Args:
+        coords: (N, 2) array-like of normalized [x, y] points.
+        scales: (N, 2) array-like of per-point (width, height), or a single
+            (width, height) pair applied to every point.
+
+    Returns:
+        (N, 2) int32 array of pixel coordinates clipped to the screen.
+    """
+    # float64 so results match the scalar normalize_coordinate() exactly
+    coords_f64 = np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 2)
+    scales_i32 = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(scales, dtype=np.int32), coords_f64.shape)
+    )
+    out = np.empty(coords_f64.shape, dtype=np.int32)
+    _denorm_kernel(coords_f64, scales_i32, out)
+    return out
+
+
+def warmup() -> None:
+    """Trigger JIT compilation ahead of the first real batch."""
+    denormalize_batch([[0.5, 0.5]], (2, 2))
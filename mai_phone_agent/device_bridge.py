@@ -17,10 +17,16 @@ This module provides ADB wrapper functionality for device connection,
 screenshot capture, and action execution on Android devices.
 """
 
+import base64
 import io
+import queue
+import re
+import struct
 import subprocess
+import threading
 import time
-from typing import Optional, Tuple, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set, Tuple, List, Dict, Any
 from PIL import Image
 
 
@@ -49,6 +55,132 @@ class ActionExecutionError(DeviceBridgeError):
     pass
 
 
+# Marker echoed after every command on the persistent shell, followed by $?
+_SHELL_SENTINEL = "__MAI_DONE__"
+
+# Seconds a successful connection check stays valid
+_VERIFY_TTL = 5.0
+
+# One line of `getprop` output: [key]: [value]
+_GETPROP_LINE = re.compile(r"^\[([^\]]+)\]: \[(.*)\]\r?$", re.MULTILINE)
+
+# Text that can go to `input text` verbatim, without any shell quoting
+_PLAIN_TEXT = re.compile(r"[A-Za-z0-9]+")
+
+# Marker between property values read in one `adb shell` call
+_PROP_SEPARATOR = "__MAI_PROP__"
+
+# Poll intervals (seconds) while waiting for a launched app to come up
+_LAUNCH_POLL_DELAYS = (0.1, 0.15, 0.25, 0.4, 0.6, 0.8)
+
+# `wm size` lines; "Override size" follows "Physical size" when set
+_WM_SIZE_PATTERN = re.compile(r"(?:Physical|Override) size:\s*(\d+)x(\d+)")
+
+# package/activity component, e.g. com.example.app/.ui.MainActivity$Inner
+_COMPONENT_PATTERN = re.compile(r"([\w.]+)/([\w.$]+)")
+
+# screencap raw pixel formats (android.graphics.PixelFormat) -> PIL rawmode.
+# Frames are unpacked straight to RGB; screenshots carry no useful alpha.
+_RAW_PIXEL_FORMATS = {
+    1: "RGBX",  # RGBA_8888
+    2: "RGBX",  # RGBX_8888
+    5: "BGRX",  # BGRA_8888
+}
+
+# screencap raw header: width, height, format (+ color space on Android 9+)
+_RAW_HEADER = struct.Struct("<III")
+_RAW_COLORSPACE_SIZE = 4
+
+
+# Per-thread BytesIO reused for PNG decoding (prefetch runs on a worker)
+_DECODE_BUFFERS = threading.local()
+
+
+def _decode_png(data: bytes) -> Image.Image:
+    """Fully decode PNG bytes through a reused per-thread buffer."""
+    buffer = getattr(_DECODE_BUFFERS, "buffer", None)
+    if buffer is None:
+        buffer = _DECODE_BUFFERS.buffer = io.BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+    buffer.write(data)
+    buffer.seek(0)
+    image = Image.open(buffer)
+    # Decode now so the buffer can be reused by the next call
+    image.load()
+    return image
+
+
+class LazyScreenshot:
+    """
+    Captured frame that defers image decoding until pixels are needed.
+    
+    Wraps either an already unpacked raw frame or PNG bytes. For PNG input
+    ``size`` is read from the header without decoding, and the bytes are
+    written back to disk as-is instead of being re-encoded.
+    """
+    
+    __slots__ = ("_data", "_image", "_size")
+    
+    def __init__(self, data: bytes = b"", image: Optional[Image.Image] = None):
+        self._data = data
+        self._image = image
+        self._size: Optional[Tuple[int, int]] = None
+    
+    @property
+    def is_png(self) -> bool:
+        """Whether the frame holds PNG bytes rather than unpacked pixels."""
+        return self._data[:8] == b"\x89PNG\r\n\x1a\n"
+    
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Frame (width, height) in pixels."""
+        if self._image is not None:
+            return self._image.size
+        if self._size is None:
+            # IHDR width/height follow the signature and chunk header
+            self._size = struct.unpack(">II", self._data[16:24])
+        return self._size
+    
+    @property
+    def image(self) -> Image.Image:
+        """Decoded PIL Image, built on first access and cached."""
+        if self._image is None:
+            try:
+                image = _decode_png(self._data)
+            except Exception as e:
+                raise ScreenshotError(f"Failed to convert screenshot to PIL Image: {e}")
+            self._image = image
+        return self._image
+    
+    def png_bytes(self) -> bytes:
+        """Frame as PNG bytes, encoding only when the source is raw."""
+        if self.is_png:
+            return self._data
+        try:
+            buffer = io.BytesIO()
+            self.image.save(buffer, format="PNG")
+            return buffer.getvalue()
+        except ScreenshotError:
+            raise
+        except Exception as e:
+            raise ScreenshotError(f"Failed to encode screenshot as PNG: {e}")
+    
+    def save_png(self, path: Any, compress_level: int = 1) -> None:
+        """
+        Write the frame to a PNG file.
+        
+        Args:
+            path: Destination file path.
+            compress_level: zlib level used when encoding raw frames.
+        """
+        if self.is_png:
+            with open(path, "wb") as f:
+                f.write(self._data)
+        else:
+            self.image.save(path, format="PNG", compress_level=compress_level)
+
+
 class DeviceBridge:
     """
     Android Device Bridge for controlling Android devices via ADB.
@@ -77,7 +209,17 @@ class DeviceBridge:
         self.device_serial = device_serial
         self.screen_width: int = 0
         self.screen_height: int = 0
-        self._screenshot_cache: Optional[bytes] = None
+        self._screenshot_cache: Optional[LazyScreenshot] = None
+        # Reused receive buffer for raw screencap frames, guarded by _frame_lock
+        # because captures can run on the executor's prefetch thread
+        self._frame_buf: Optional[bytearray] = None
+        self._frame_lock = threading.Lock()
+        self._shell: Optional[subprocess.Popen] = None
+        self._shell_lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._shell_lock = threading.Lock()
+        self._last_verified: float = 0.0
+        self._prop_cache: Dict[str, str] = {}
+        self._package_set: Optional[Set[str]] = None
         
         self.connect(device_serial)
     
@@ -94,8 +236,10 @@ class DeviceBridge:
                 raise Exception(f"ADB command failed: {result.stderr}")
             return result.stdout.strip()
         except subprocess.TimeoutExpired:
+            self._last_verified = 0.0
             raise DeviceDisconnectedError("ADB command timed out")
         except Exception as e:
+            self._last_verified = 0.0
             raise DeviceDisconnectedError(f"ADB command failed: {e}")
     
     def _adb_command_bytes(self, *args) -> bytes:
@@ -111,14 +255,157 @@ class DeviceBridge:
                 raise Exception(f"ADB command failed: {result.stderr.decode()}")
             return result.stdout
         except subprocess.TimeoutExpired:
+            self._last_verified = 0.0
             raise DeviceDisconnectedError("ADB command timed out")
         except Exception as e:
+            self._last_verified = 0.0
             raise DeviceDisconnectedError(f"ADB command failed: {e}")
     
+    def _open_shell(self) -> None:
+        """Start the long-lived ``adb shell`` process and its reader thread."""
+        cmd = ["adb"]
+        if self.device_serial:
+            cmd.extend(["-s", self.device_serial])
+        cmd.append("shell")
+        
+        self._shell = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            # dumpsys/getprop output is not always valid UTF-8
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+        self._shell_lines = queue.Queue()
+        reader = threading.Thread(
+            target=self._read_shell,
+            args=(self._shell.stdout, self._shell_lines),
+            daemon=True,
+        )
+        reader.start()
+    
+    @staticmethod
+    def _read_shell(stream, lines: "queue.Queue[Optional[str]]") -> None:
+        """Forward shell output lines to the queue; None marks EOF."""
+        try:
+            for line in stream:
+                lines.put(line)
+        finally:
+            # Also on a read error, so callers see a disconnect right away
+            lines.put(None)
+    
+    def _close_shell(self) -> None:
+        """Terminate the persistent shell if it is running."""
+        self._last_verified = 0.0  # Re-ping before trusting the device again
+        if self._shell is not None:
+            try:
+                self._shell.stdin.close()
+                self._shell.terminate()
+                self._shell.wait(timeout=2)
+            except Exception:
+                self._shell.kill()
+            self._shell = None
+    
+    def close(self) -> None:
+        """Release the persistent shell process."""
+        with self._shell_lock:
+            self._close_shell()
+    
+    def _send_shell(self, *args: str, timeout: float = 30) -> str:
+        """
+        Run a command on the persistent ``adb shell`` and return its output.
+        
+        Arguments are joined with spaces exactly like ``adb shell a b c``, so
+        escaping rules are unchanged from one-shot invocations.
+        
+        Args:
+            *args: Command and arguments.
+            timeout: Seconds to wait for the command to finish.
+            
+        Returns:
+            Command output with surrounding whitespace stripped.
+            
+        Raises:
+            ActionExecutionError: If the command exits with a non-zero status.
+            DeviceDisconnectedError: If the shell dies or the command times out.
+        """
+        with self._shell_lock:
+            if self._shell is None or self._shell.poll() is not None:
+                self._open_shell()
+            
+            command = " ".join(args)
+            try:
+                self._shell.stdin.write(f"{command}; echo {_SHELL_SENTINEL}$?\n")
+                self._shell.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                self._close_shell()
+                raise DeviceDisconnectedError(f"ADB shell closed: {e}")
+            
+            deadline = time.monotonic() + timeout
+            output = []
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    line = self._shell_lines.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    self._close_shell()
+                    raise DeviceDisconnectedError(f"ADB shell command timed out: {command}")
+                if line is None:
+                    self._close_shell()
+                    raise DeviceDisconnectedError("ADB shell closed unexpectedly")
+                
+                head, sep, tail = line.partition(_SHELL_SENTINEL)
+                if sep:
+                    output.append(head)
+                    break
+                output.append(line)
+        
+        text = "".join(output).strip()
+        status = tail.strip()
+        if status != "0":
+            self._last_verified = 0.0
+            raise ActionExecutionError(f"Command '{command}' exited with status {status}: {text}")
+        return text
+    
+    @staticmethod
+    def _fetch_device_info(serial: str, state: str) -> Dict[str, str]:
+        """
+        Build the list_devices() entry for one device.
+        
+        Model and Android version are read with a single ``adb shell``.
+        """
+        model = "Unknown"
+        version = "Unknown"
+        if state == "device":
+            try:
+                cmd = [
+                    "adb", "-s", serial, "shell",
+                    f"getprop ro.product.model; echo {_PROP_SEPARATOR}; getprop ro.build.version.release",
+                ]
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+                if result.returncode == 0:
+                    model_out, sep, version_out = result.stdout.partition(_PROP_SEPARATOR)
+                    if sep:
+                        model = model_out.strip()
+                        version = version_out.strip()
+            except:
+                pass
+        
+        return {
+            "serial": serial,
+            "state": state,
+            "model": model,
+            "android_version": version
+        }
+    
     def list_devices(self) -> List[Dict[str, str]]:
         """
         List all connected Android devices.
         
+        Device properties are queried concurrently, one thread per device.
+        
         Returns:
             List of device info dicts with keys: serial, state, model, android_version.
         """
@@ -126,40 +413,17 @@ class DeviceBridge:
             result = subprocess.run(["adb", "devices"], capture_output=True, text=True, timeout=10)
             lines = result.stdout.strip().split('\n')[1:]  # Skip "List of devices attached"
             
-            devices = []
+            entries = []
             for line in lines:
-                line = line.strip()
-                if line:
-                    parts = line.split('\t')
-                    if len(parts) >= 2:
-                        serial = parts[0]
-                        state = parts[1]
-                        
-                        # Try to get device info
-                        model = "Unknown"
-                        version = "Unknown"
-                        if state == "device":
-                            try:
-                                model_cmd = ["adb", "-s", serial, "shell", "getprop", "ro.product.model"]
-                                model_result = subprocess.run(model_cmd, capture_output=True, text=True, timeout=5)
-                                if model_result.returncode == 0:
-                                    model = model_result.stdout.strip()
-                                
-                                version_cmd = ["adb", "-s", serial, "shell", "getprop", "ro.build.version.release"]
-                                version_result = subprocess.run(version_cmd, capture_output=True, text=True, timeout=5)
-                                if version_result.returncode == 0:
-                                    version = version_result.stdout.strip()
-                            except:
-                                pass
-                        
-                        devices.append({
-                            "serial": serial,
-                            "state": state,
-                            "model": model,
-                            "android_version": version
-                        })
+                parts = line.strip().split('\t')
+                if len(parts) >= 2:
+                    entries.append((parts[0], parts[1]))
+            
+            if not entries:
+                return []
             
-            return devices
+            with ThreadPoolExecutor(max_workers=min(16, len(entries))) as pool:
+                return list(pool.map(lambda entry: self._fetch_device_info(*entry), entries))
         except Exception as e:
             raise DeviceBridgeError(f"Failed to list devices: {e}")
     
@@ -205,6 +469,7 @@ class DeviceBridge:
             
             # Verify connection and get screen size
             self._verify_connection()
+            self._load_props()
             self.screen_width, self.screen_height = self.get_screen_size()
             
         except DeviceNotFoundError:
@@ -212,16 +477,47 @@ class DeviceBridge:
         except Exception as e:
             raise DeviceDisconnectedError(f"Failed to connect to device: {e}")
     
+    def _load_props(self) -> None:
+        """Seed the property cache from a single bulk ``getprop`` call."""
+        self._prop_cache = {}
+        try:
+            output = self._adb_command("shell", "getprop")
+        except Exception:
+            return  # Properties are then fetched one by one on demand
+        self._prop_cache.update(_GETPROP_LINE.findall(output))
+    
+    def _prop(self, key: str, default: str = "Unknown") -> str:
+        """
+        Get a system property, cached for the lifetime of the connection.
+        
+        Args:
+            key: Property name, e.g. "ro.product.model".
+            default: Value returned if the property cannot be read.
+        """
+        value = self._prop_cache.get(key)
+        if value is None:
+            try:
+                value = self._adb_command("shell", "getprop", key)
+            except Exception:
+                return default
+            self._prop_cache[key] = value
+        return value
+    
     def _verify_connection(self) -> None:
         """Verify device connection is healthy."""
         if not self.device_serial:
             raise DeviceDisconnectedError("Device not connected")
         
+        now = time.monotonic()
+        if now - self._last_verified < _VERIFY_TTL:
+            return
+        
         try:
-            # Simple ping to verify connection
-            self._adb_command("shell", "echo", "ping")
+            # Simple ping over the persistent shell
+            self._send_shell("echo", "ping", timeout=10)
         except Exception as e:
             raise DeviceDisconnectedError(f"Device connection lost: {e}")
+        self._last_verified = now
     
     def reconnect(self, max_retries: int = 3) -> bool:
         """
@@ -257,56 +553,149 @@ class DeviceBridge:
         self._verify_connection()
         
         try:
-            # Use wm size command
-            output = self._adb_command("shell", "wm", "size")
-            # Output format: "Physical size: 1080x1920"
-            size_str = output.strip().split(":")[-1].strip()
-            width, height = map(int, size_str.split("x"))
-            return width, height
+            # Output format: "Physical size: 1080x1920" (+ "Override size: ...")
+            output = self._send_shell("wm", "size")
+            sizes = _WM_SIZE_PATTERN.findall(output)
+            if not sizes:
+                raise ValueError(f"unexpected 'wm size' output: {output!r}")
+            # The effective size is the last one reported
+            width, height = sizes[-1]
+            return int(width), int(height)
         except Exception as e:
             raise DeviceDisconnectedError(f"Failed to get screen size: {e}")
     
+    def _read_raw_frame(self, timeout: float = 30) -> Optional[Image.Image]:
+        """
+        Capture a frame with raw ``screencap`` into the reused buffer.
+        
+        Pixels are read with ``readinto`` into ``self._frame_buf`` and then
+        unpacked into a new RGB image, so the result stays valid after the
+        buffer is overwritten by the next capture.
+        
+        Returns:
+            PIL Image, or None if the device's raw layout is not recognized.
+            
+        Raises:
+            DeviceDisconnectedError: If the stream ends early or times out.
+        """
+        with self._frame_lock:
+            try:
+                return self._read_raw_frame_locked(timeout)
+            except DeviceDisconnectedError:
+                self._last_verified = 0.0
+                raise
+    
+    def _read_raw_frame_locked(self, timeout: float) -> Optional[Image.Image]:
+        """Body of _read_raw_frame; the caller holds ``_frame_lock``."""
+        cmd = ["adb"]
+        if self.device_serial:
+            cmd.extend(["-s", self.device_serial])
+        cmd.extend(["exec-out", "screencap"])
+        
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        timed_out = threading.Event()
+        
+        def kill() -> None:
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            header = proc.stdout.read(_RAW_HEADER.size)
+            if len(header) < _RAW_HEADER.size:
+                raise DeviceDisconnectedError("screencap returned no data")
+            width, height, pixel_format = _RAW_HEADER.unpack(header)
+            if pixel_format not in _RAW_PIXEL_FORMATS:
+                return None
+            
+            # Room for the optional color-space word plus the pixels
+            frame_size = width * height * 4
+            need = frame_size + _RAW_COLORSPACE_SIZE
+            if self._frame_buf is None or len(self._frame_buf) < need:
+                self._frame_buf = bytearray(need)
+            view = memoryview(self._frame_buf)[:need]
+            
+            received = 0
+            while received < need:
+                count = proc.stdout.readinto(view[received:])
+                if not count:
+                    break
+                received += count
+            
+            if timed_out.is_set():
+                raise DeviceDisconnectedError(f"screencap timed out after {timeout}s")
+            offset = received - frame_size
+            if offset not in (0, _RAW_COLORSPACE_SIZE):
+                raise DeviceDisconnectedError(
+                    f"screencap stream truncated ({received} of {frame_size} bytes)"
+                )
+            if proc.stdout.read(1):
+                # More data than the header describes: unknown layout
+                return None
+            
+            return Image.frombytes(
+                "RGB", (width, height), view[offset:received],
+                "raw", _RAW_PIXEL_FORMATS[pixel_format],
+            )
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+    
+    def _capture_frame(self) -> LazyScreenshot:
+        """Capture a frame, preferring raw screencap over the PNG path."""
+        image = self._read_raw_frame()
+        if image is not None:
+            return LazyScreenshot(image=image)
+        
+        # Unknown raw layout on this device, use the PNG encoder instead
+        return LazyScreenshot(self._adb_command_bytes("exec-out", "screencap", "-p"))
+    
     def capture_screenshot(self, format: str = "pil", use_cache: bool = False) -> Any:
         """
         Capture device screenshot.
         
+        Frames are pulled as raw pixels (``screencap`` without ``-p``) so
+        neither the device nor the host spends time on PNG encode/decode.
+        
         Args:
-            format: Output format - "pil" for PIL Image, "bytes" for raw PNG bytes.
+            format: Output format - "pil" for PIL Image, "bytes" for PNG bytes,
+                "lazy" for a LazyScreenshot that decodes on first access.
             use_cache: If True, return cached screenshot if available.
             
         Returns:
-            PIL Image or bytes depending on format parameter.
+            PIL Image, bytes or LazyScreenshot depending on format parameter.
             
         Raises:
             ScreenshotError: If screenshot capture fails.
         """
-        if use_cache and self._screenshot_cache:
-            img_bytes = self._screenshot_cache
+        if format not in ("pil", "bytes", "lazy"):
+            raise ValueError(f"Invalid format: {format}. Use 'pil', 'bytes' or 'lazy'.")
+        
+        if use_cache and self._screenshot_cache is not None:
+            shot = self._screenshot_cache
         else:
             self._verify_connection()
             
             try:
-                # Capture screenshot using adb exec-out screencap
-                img_bytes = self._adb_command_bytes("exec-out", "screencap", "-p")
-                self._screenshot_cache = img_bytes
+                shot = self._capture_frame()
             except Exception as e:
                 # Retry once
                 try:
                     time.sleep(0.5)
-                    img_bytes = self._adb_command_bytes("exec-out", "screencap", "-p")
-                    self._screenshot_cache = img_bytes
+                    shot = self._capture_frame()
                 except Exception as retry_error:
                     raise ScreenshotError(f"Failed to capture screenshot: {retry_error}")
+            self._screenshot_cache = shot
         
+        if format == "lazy":
+            return shot
         if format == "bytes":
-            return img_bytes
-        elif format == "pil":
-            try:
-                return Image.open(io.BytesIO(img_bytes))
-            except Exception as e:
-                raise ScreenshotError(f"Failed to convert screenshot to PIL Image: {e}")
-        else:
-            raise ValueError(f"Invalid format: {format}. Use 'pil' or 'bytes'.")
+            return shot.png_bytes()
+        return shot.image
     
     def tap(self, x: int, y: int) -> None:
         """
@@ -329,7 +718,7 @@ class DeviceBridge:
         self._verify_connection()
         
         try:
-            self._adb_command("shell", "input", "tap", str(x), str(y))
+            self._send_shell("input", "tap", str(x), str(y))
             # Clear screenshot cache after action
             self._screenshot_cache = None
         except Exception as e:
@@ -360,7 +749,7 @@ class DeviceBridge:
         self._verify_connection()
         
         try:
-            self._adb_command("shell", "input", "swipe", str(x1), str(y1), str(x2), str(y2), str(duration))
+            self._send_shell("input", "swipe", str(x1), str(y1), str(x2), str(y2), str(duration))
             self._screenshot_cache = None
         except Exception as e:
             raise ActionExecutionError(f"Failed to execute swipe: {e}")
@@ -385,6 +774,8 @@ class DeviceBridge:
         """
         Type text into focused input field.
         
+        Newlines are sent as ENTER key presses between the lines.
+        
         Args:
             text: Text to type.
             
@@ -393,10 +784,26 @@ class DeviceBridge:
         """
         self._verify_connection()
         
+        commands = []
+        for index, line in enumerate(text.replace("\r\n", "\n").split("\n")):
+            if index:
+                commands.append("input keyevent 66")
+            if not line:
+                continue
+            if _PLAIN_TEXT.fullmatch(line):
+                commands.append(f"input text {line}")
+            else:
+                # Ship the line base64-encoded so no character needs shell
+                # escaping; `input text` wants spaces as %s
+                encoded = base64.b64encode(line.encode("utf-8")).decode("ascii")
+                commands.append(
+                    f"input text \"$(echo {encoded} | base64 -d | sed 's/ /%s/g')\""
+                )
+        if not commands:
+            return
+        
         try:
-            # Escape special characters for shell
-            escaped_text = text.replace(" ", "%s").replace("&", "\\&")
-            self._adb_command("shell", "input", "text", escaped_text)
+            self._send_shell(" && ".join(commands))
             self._screenshot_cache = None
         except Exception as e:
             raise ActionExecutionError(f"Failed to type text: {e}")
@@ -424,31 +831,60 @@ class DeviceBridge:
         self._verify_connection()
         
         try:
-            self._adb_command("shell", "input", "keyevent", str(keycode))
+            self._send_shell("input", "keyevent", str(keycode))
             self._screenshot_cache = None
         except Exception as e:
             raise ActionExecutionError(f"Failed to press {name}: {e}")
     
-    def launch_app(self, package_name: str) -> None:
+    def launch_app(self, package_name: str, wait_timeout_ms: int = 2000) -> None:
         """
         Launch app by package name.
         
+        Returns as soon as the app's activity is in the foreground, or after
+        ``wait_timeout_ms`` if it never shows up.
+        
         Args:
             package_name: Android package name (e.g., "com.android.chrome").
+            wait_timeout_ms: Upper bound on the wait for the app to load.
             
         Raises:
             ActionExecutionError: If app launch fails.
         """
         self._verify_connection()
         
+        if self._package_set is not None and package_name not in self._package_set:
+            # Possibly installed since the list was cached
+            self._package_set = None
+        
         try:
             # Launch app using monkey command
             self._adb_command("shell", "monkey", "-p", package_name, "-c", "android.intent.category.LAUNCHER", "1")
-            time.sleep(2)  # Wait for app to load
+            self._wait_for_package(package_name, wait_timeout_ms / 1000)
             self._screenshot_cache = None
         except Exception as e:
             raise ActionExecutionError(f"Failed to launch app {package_name}: {e}")
     
+    def _wait_for_package(self, package_name: str, timeout: float) -> bool:
+        """
+        Poll the foreground activity until it belongs to ``package_name``.
+        
+        Returns:
+            True if the package came to the foreground within ``timeout``.
+        """
+        deadline = time.monotonic() + timeout
+        step = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Back off, then keep polling at the longest interval
+            delay = _LAUNCH_POLL_DELAYS[min(step, len(_LAUNCH_POLL_DELAYS) - 1)]
+            time.sleep(min(delay, remaining))
+            step += 1
+            package, _ = self.get_current_activity()
+            if package == package_name:
+                return True
+    
     def get_device_info(self) -> Dict[str, str]:
         """
         Get device information.
@@ -458,24 +894,12 @@ class DeviceBridge:
         """
         self._verify_connection()
         
-        try:
-            model = self._adb_command("shell", "getprop", "ro.product.model")
-            version = self._adb_command("shell", "getprop", "ro.build.version.release")
-            api_level = self._adb_command("shell", "getprop", "ro.build.version.sdk")
-            
-            return {
-                "model": model,
-                "android_version": version,
-                "api_level": api_level,
-                "serial": self.device_serial,
-            }
-        except Exception:
-            return {
-                "model": "Unknown",
-                "android_version": "Unknown",
-                "api_level": "Unknown",
-                "serial": self.device_serial or "Unknown",
-            }
+        return {
+            "model": self._prop("ro.product.model"),
+            "android_version": self._prop("ro.build.version.release"),
+            "api_level": self._prop("ro.build.version.sdk"),
+            "serial": self.device_serial or "Unknown",
+        }
     
     def is_app_installed(self, package_name: str) -> bool:
         """
@@ -490,11 +914,30 @@ class DeviceBridge:
         self._verify_connection()
         
         try:
-            output = self._adb_command("shell", "pm", "list", "packages")
-            return package_name in output
+            return package_name in self._packages()
         except Exception:
             return False
     
+    def _packages(self, refresh: bool = False) -> Set[str]:
+        """
+        Installed package names, fetched once with ``pm list packages``.
+        
+        Args:
+            refresh: Re-query the device instead of using the cached set.
+        """
+        if self._package_set is None or refresh:
+            output = self._adb_command("shell", "pm", "list", "packages")
+            self._package_set = {
+                line[len("package:"):].strip()
+                for line in output.splitlines()
+                if line.startswith("package:")
+            }
+        return self._package_set
+    
+    def refresh_packages(self) -> None:
+        """Drop the cached package list, e.g. after installing an app."""
+        self._package_set = None
+    
     def get_current_activity(self) -> Tuple[str, str]:
         """
         Get current foreground activity.
@@ -505,14 +948,19 @@ class DeviceBridge:
         self._verify_connection()
         
         try:
-            output = self._adb_command("shell", "dumpsys", "window", "windows")
-            # Parse output like: mCurrentFocus=Window{abc123 u0 com.example.app/com.example.MainActivity}
-            for line in output.split('\n'):
-                if 'mCurrentFocus' in line and "/" in line:
-                    parts = line.split("/")
-                    package = parts[0].split()[-1]
-                    activity = parts[1].split("}")[0]
-                    return package, activity
+            # Resumed activity line only, instead of the whole window dump
+            output = self._send_shell(
+                "dumpsys activity activities | grep -E 'mResumedActivity|ResumedActivity' | head -n1"
+            )
+            match = _COMPONENT_PATTERN.search(output)
+            if match:
+                return match.group(1), match.group(2)
+            
+            # Fallback: parse output like: mCurrentFocus=Window{abc123 u0 com.example.app/com.example.MainActivity}
+            output = self._send_shell("dumpsys window windows | grep mCurrentFocus")
+            match = _COMPONENT_PATTERN.search(output)
+            if match:
+                return match.group(1), match.group(2)
             return "Unknown", "Unknown"
         except Exception:
             return "Unknown", "Unknown"
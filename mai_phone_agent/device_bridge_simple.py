@@ -4,12 +4,17 @@
 """Simple Android Device Bridge using subprocess ADB calls."""
 
 import io
+import re
 import subprocess
 import time
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Set, Tuple, List, Dict, Any
 from PIL import Image
 
 
+# `wm size` lines; "Override size" follows "Physical size" when set
+_WM_SIZE_PATTERN = re.compile(r"(?:Physical|Override) size:\s*(\d+)x(\d+)")
+
+
 class DeviceBridge:
     """Simple ADB wrapper using subprocess calls."""
     
@@ -18,6 +23,11 @@ class DeviceBridge:
         self.device_serial = device_serial
         self.screen_width = 0
         self.screen_height = 0
+        # package name -> launcher component ("pkg/.Activity")
+        self._activity_cache: Dict[str, str] = {}
+        self._package_set: Optional[Set[str]] = None
+        # Reused for PNG decoding in capture_screenshot
+        self._pil_buf = io.BytesIO()
         
         try:
             self.screen_width, self.screen_height = self.get_screen_size()
@@ -75,11 +85,11 @@ class DeviceBridge:
         """Get screen dimensions."""
         try:
             output = self._adb_command("shell", "wm", "size")
-            # Output: "Physical size: 1080x1920"
-            if "Physical size:" in output:
-                size_str = output.split(":")[-1].strip()
-                width, height = map(int, size_str.split("x"))
-                return width, height
+            # Output: "Physical size: 1080x1920" (+ "Override size: ...")
+            sizes = _WM_SIZE_PATTERN.findall(output)
+            if sizes:
+                width, height = sizes[-1]
+                return int(width), int(height)
         except:
             pass
         raise Exception("Could not parse screen size")
@@ -91,7 +101,13 @@ class DeviceBridge:
         if format == "bytes":
             return img_bytes
         elif format == "pil":
-            image = Image.open(io.BytesIO(img_bytes))
+            self._pil_buf.seek(0)
+            self._pil_buf.truncate()
+            self._pil_buf.write(img_bytes)
+            self._pil_buf.seek(0)
+            image = Image.open(self._pil_buf)
+            # Decode now so the buffer can be reused by the next capture
+            image.load()
             # Update screen size from screenshot if not set
             if self.screen_width == 0:
                 self.screen_width, self.screen_height = image.size
@@ -112,13 +128,67 @@ class DeviceBridge:
         """Long press."""
         self.swipe(x, y, x, y, duration)
     
+    def resolve_launch_activity(self, package_name: str) -> Optional[str]:
+        """Resolve (and cache) the launcher component of a package."""
+        if package_name in self._activity_cache:
+            return self._activity_cache[package_name]
+        
+        try:
+            output = self._adb_command(
+                "shell", "cmd", "package", "resolve-activity", "--brief",
+                "-c", "android.intent.category.LAUNCHER", package_name
+            )
+        except Exception:
+            return None
+        
+        # Output ends with "pkg/.Activity", or "No activity found"
+        lines = output.splitlines()
+        component = lines[-1].strip() if lines else ""
+        if "/" not in component:
+            return None
+        self._activity_cache[package_name] = component
+        return component
+    
+    def launch_app(self, package_name: str) -> None:
+        """Launch an app, preferring a direct `am start` over monkey."""
+        if self._package_set is not None and package_name not in self._package_set:
+            # Possibly installed since the list was cached
+            self._package_set = None
+        
+        component = self.resolve_launch_activity(package_name)
+        if component:
+            try:
+                output = self._adb_command("shell", "am", "start", "-n", component)
+                if "Error" not in output:
+                    return
+            except Exception:
+                pass
+            # Stale component (e.g. app updated), resolve again next time
+            self._activity_cache.pop(package_name, None)
+        
+        self._adb_command("shell", "monkey", "-p", package_name, "-c", "android.intent.category.LAUNCHER", "1")
+    
     def is_app_installed(self, package_name: str) -> bool:
         """Check if an app is installed."""
         try:
-            output = self._adb_command("shell", "pm", "list", "packages", package_name)
-            return f"package:{package_name}" in output
+            return package_name in self._packages()
         except:
             return False
+    
+    def _packages(self, refresh: bool = False) -> Set[str]:
+        """Installed package names, fetched once and cached."""
+        if self._package_set is None or refresh:
+            output = self._adb_command("shell", "pm", "list", "packages")
+            self._package_set = {
+                line[len("package:"):].strip()
+                for line in output.splitlines()
+                if line.startswith("package:")
+            }
+        return self._package_set
+    
+    def refresh_packages(self) -> None:
+        """Drop the cached package list, e.g. after installing an app."""
+        self._package_set = None
 
     def type_text(self, text: str) -> tuple:
         """
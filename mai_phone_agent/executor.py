@@ -21,26 +21,50 @@ import json
 import logging
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, BinaryIO, Tuple, Union
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
 from mai_phone_agent.device_bridge import DeviceBridge
 from mai_phone_agent.integration import AgentIntegration, ActionParseError, ActionValidationError
 from mai_phone_agent.config import Config
-from mai_phone_agent.utils import pil_to_base64, truncate_text
+from mai_phone_agent.utils import truncate_text
 
 
 logger = logging.getLogger(__name__)
 
+# Files written to each task log directory
+TRAJECTORY_FILE = "trajectory.jsonl"
+SUMMARY_FILE = "summary.json"
+
+
+def _encode_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON, using orjson when it is installed.
+    
+    orjson encodes dataclasses natively in one pass; the stdlib fallback
+    goes through asdict() first.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if hasattr(obj, "__dataclass_fields__"):
+        obj = asdict(obj)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
 
 @dataclass
 class ExecutionStep:
     """Single step in task execution trajectory."""
     step_number: int
-    timestamp: str
-    screenshot_b64: Optional[str]
+    timestamp_offset_ms: int  # Milliseconds since the task started
+    screenshot_path: Optional[str]  # Relative to the task log directory
     thinking: Optional[str]
     action: Dict[str, Any]
     action_result: str  # "success", "failed", or "skipped"
@@ -59,6 +83,7 @@ class ExecutionResult:
     trajectory: List[ExecutionStep]
     final_message: Optional[str] = None
     error: Optional[str] = None
+    started_at: Optional[str] = None  # Wall-clock start, ISO 8601
 
 
 class TaskExecutor:
@@ -97,6 +122,23 @@ class TaskExecutor:
         self.user_prompt_handler = user_prompt_handler or self._default_user_prompt
         self.trajectory: List[ExecutionStep] = []
         self.task_id: str = ""
+        self._task_start_wall: Optional[str] = None
+        self._task_start_monotonic: float = 0.0
+        
+        # Single worker that captures the next observation in the background;
+        # started per task and shut down when the task is finalized
+        self._screenshot_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_shot: Optional[Future] = None
+        
+        # trajectory.jsonl of the running task, opened on the first step
+        self._traj_fp: Optional[BinaryIO] = None
+        
+        # Executor-side handling per action type; device actions fall through
+        self._action_handlers: Dict[str, Callable[[Dict[str, Any]], Tuple[str, bool]]] = {
+            "FINISH": self._handle_finish,
+            "ask_user": self._handle_ask_user,
+            "mcp_call": self._handle_mcp_call,
+        }
         
         logger.info("Initialized TaskExecutor")
     
@@ -112,7 +154,12 @@ class TaskExecutor:
         """
         self.task_id = self._generate_task_id()
         self.trajectory = []
+        self._discard_pending_shot()
+        if self._screenshot_pool is None:
+            self._screenshot_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot")
         start_time = time.time()
+        self._task_start_wall = datetime.now().isoformat()
+        self._task_start_monotonic = time.monotonic()
         
         logger.info(f"Starting task execution: {instruction}")
         logger.info(f"Task ID: {self.task_id}")
@@ -140,20 +187,22 @@ class TaskExecutor:
                         done = True
                         logger.info("Task completed: FINISH action received")
                     
-                    # Delay between actions
-                    if not done and step_count < max_steps:
-                        time.sleep(self.config.execution.screenshot_delay)
+                    # The delay between actions is spent inside the prefetch job
+                    # started by _execute_step, overlapping with step bookkeeping
                 
                 except KeyboardInterrupt:
                     logger.warning("Task interrupted by user (Ctrl+C)")
                     duration = time.time() - start_time
-                    return self._create_result(
+                    result = self._create_result(
                         instruction, "interrupted", step_count, duration,
                         final_message="Task interrupted by user"
                     )
+                    self._finalize_trajectory(result)
+                    return result
                 
                 except Exception as e:
                     logger.error(f"Step {step_count} failed: {e}")
+                    self._discard_pending_shot()
                     
                     # Try to retry if configured
                     if self._should_retry(e):
@@ -162,10 +211,12 @@ class TaskExecutor:
                     else:
                         # Fatal error, abort task
                         duration = time.time() - start_time
-                        return self._create_result(
+                        result = self._create_result(
                             instruction, "failed", step_count, duration,
                             error=str(e)
                         )
+                        self._finalize_trajectory(result)
+                        return result
             
             # Task completed
             duration = time.time() - start_time
@@ -183,17 +234,19 @@ class TaskExecutor:
                 instruction, status, step_count, duration, final_message=final_message
             )
             
-            # Save trajectory
-            self._save_trajectory(result)
+            # Write trajectory summary
+            self._finalize_trajectory(result)
             
             return result
             
         except Exception as e:
             logger.error(f"Fatal error during task execution: {e}")
             duration = time.time() - start_time
-            return self._create_result(
+            result = self._create_result(
                 instruction, "failed", 0, duration, error=str(e)
             )
+            self._finalize_trajectory(result)
+            return result
     
     def _execute_step(
         self, instruction: str, step_number: int, max_steps: int
@@ -211,12 +264,11 @@ class TaskExecutor:
         """
         step_start_time = time.time()
         
-        # 1. Capture observation
-        logger.debug("Capturing screenshot...")
-        screenshot = self.agent_integration.device_bridge.capture_screenshot(format="pil")
+        # 1. Capture observation (prefetched after the previous action if possible)
+        screenshot = self._take_screenshot()
         
         observation = self.agent_integration.format_observation(
-            screenshot,
+            screenshot.image,
             include_metadata=True,
             step_count=step_number,
             max_steps=max_steps,
@@ -240,34 +292,12 @@ class TaskExecutor:
         logger.info(f"Agent action: {action['action']}")
         
         # 3. Handle special actions
-        should_finish = False
-        action_result = "success"
-        
-        if action["action"] == "FINISH":
-            should_finish = True
-            action_result = "success"
+        handler = self._action_handlers.get(action["action"], self._handle_device_action)
+        action_result, should_finish = handler(action)
         
-        elif action["action"] == "ask_user":
-            # Handle user interaction
-            question = action.get("question", "Agent needs input")
-            logger.info(f"Agent asks: {question}")
-            
-            try:
-                user_response = self.user_prompt_handler(question)
-                logger.info(f"User response: {user_response}")
-                # TODO: Inject response into next observation
-                action_result = "success"
-            except Exception as e:
-                logger.error(f"User prompt failed: {e}")
-                action_result = "failed"
-                raise
-        
-        elif action["action"] == "mcp_call":
-            # Handle MCP tool call (placeholder)
-            tool_name = action.get("tool", "unknown")
-            logger.info(f"MCP call: {tool_name}")
-            logger.warning("MCP tool calls not yet implemented")
-            action_result = "skipped"
+        # Start capturing the next observation while this step is recorded
+        if not should_finish and step_number < max_steps:
+            self._prefetch_screenshot()
         
         # 4. Record step
         execution_time_ms = (time.time() - step_start_time) * 1000
@@ -278,6 +308,66 @@ class TaskExecutor:
         
         return action_result, should_finish
     
+    def _handle_finish(self, action: Dict[str, Any]) -> Tuple[str, bool]:
+        """Finish the task."""
+        return "success", True
+    
+    def _handle_ask_user(self, action: Dict[str, Any]) -> Tuple[str, bool]:
+        """Relay the agent's question to the user."""
+        question = action.get("question", "Agent needs input")
+        logger.info(f"Agent asks: {question}")
+        
+        try:
+            user_response = self.user_prompt_handler(question)
+            logger.info(f"User response: {user_response}")
+            # TODO: Inject response into next observation
+            return "success", False
+        except Exception as e:
+            logger.error(f"User prompt failed: {e}")
+            raise
+    
+    def _handle_mcp_call(self, action: Dict[str, Any]) -> Tuple[str, bool]:
+        """Handle MCP tool call (placeholder)."""
+        tool_name = action.get("tool", "unknown")
+        logger.info(f"MCP call: {tool_name}")
+        logger.warning("MCP tool calls not yet implemented")
+        return "skipped", False
+    
+    def _handle_device_action(self, action: Dict[str, Any]) -> Tuple[str, bool]:
+        """Device actions were already executed by the integration layer."""
+        return "success", False
+    
+    def _capture_after_delay(self) -> Any:
+        """Wait for the UI to settle, then capture a screenshot."""
+        time.sleep(self.config.execution.screenshot_delay)
+        return self.agent_integration.device_bridge.capture_screenshot(format="lazy")
+    
+    def _prefetch_screenshot(self) -> None:
+        """Schedule capture of the next observation on the background worker."""
+        self._pending_shot = self._screenshot_pool.submit(self._capture_after_delay)
+    
+    def _discard_pending_shot(self) -> None:
+        """Cancel or wait out the prefetch so it never overlaps another capture."""
+        pending, self._pending_shot = self._pending_shot, None
+        if pending is not None and not pending.cancel():
+            try:
+                pending.result()
+            except Exception as e:
+                logger.debug(f"Discarded prefetched screenshot failed: {e}")
+    
+    def _take_screenshot(self) -> Any:
+        """Return the prefetched screenshot, or capture one synchronously."""
+        pending, self._pending_shot = self._pending_shot, None
+        if pending is not None:
+            logger.debug("Waiting for prefetched screenshot...")
+            try:
+                return pending.result()
+            except Exception as e:
+                logger.warning(f"Prefetched screenshot failed, capturing again: {e}")
+        
+        logger.debug("Capturing screenshot...")
+        return self.agent_integration.device_bridge.capture_screenshot(format="lazy")
+    
     def _record_step(
         self,
         step_number: int,
@@ -289,18 +379,23 @@ class TaskExecutor:
         execution_time_ms: float = 0.0,
     ) -> None:
         """Record execution step in trajectory."""
-        # Convert screenshot to base64 for storage
-        screenshot_b64 = None
+        # Write screenshot next to the trajectory instead of embedding it
+        screenshot_path = None
         if screenshot and self.config.logging.save_screenshots:
             try:
-                screenshot_b64 = pil_to_base64(screenshot)
+                screenshot_path = f"screenshots/step_{step_number:04d}.png"
+                file_path = self._task_log_dir() / screenshot_path
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                # Low compression: favor speed over file size
+                screenshot.save_png(file_path, compress_level=1)
             except Exception as e:
-                logger.warning(f"Failed to encode screenshot: {e}")
+                screenshot_path = None
+                logger.warning(f"Failed to save screenshot: {e}")
         
         step = ExecutionStep(
             step_number=step_number,
-            timestamp=datetime.now().isoformat(),
-            screenshot_b64=screenshot_b64,
+            timestamp_offset_ms=int((time.monotonic() - self._task_start_monotonic) * 1000),
+            screenshot_path=screenshot_path,
             thinking=thinking,
             action=action,
             action_result=result,
@@ -309,6 +404,7 @@ class TaskExecutor:
         )
         
         self.trajectory.append(step)
+        self._append_trajectory(step)
     
     def _should_retry(self, error: Exception) -> bool:
         """Determine if error is retryable."""
@@ -322,6 +418,10 @@ class TaskExecutor:
         response = input("Your response: ")
         return response
     
+    def _task_log_dir(self) -> Path:
+        """Directory holding the trajectory and screenshots of the current task."""
+        return Path(self.config.logging.output_dir) / self.task_id
+    
     def _generate_task_id(self) -> str:
         """Generate unique task ID."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -347,36 +447,94 @@ class TaskExecutor:
             trajectory=self.trajectory,
             final_message=final_message,
             error=error,
+            started_at=self._task_start_wall,
         )
     
-    def _save_trajectory(self, result: ExecutionResult) -> None:
-        """Save trajectory to JSON file."""
+    def _append_trajectory(self, step: ExecutionStep) -> None:
+        """Append one step to trajectory.jsonl as soon as it is recorded."""
+        if not self.config.logging.save_trajectory:
+            return
+        
+        try:
+            if self._traj_fp is None:
+                log_dir = self._task_log_dir()
+                log_dir.mkdir(parents=True, exist_ok=True)
+                self._traj_fp = open(log_dir / TRAJECTORY_FILE, "ab")
+            
+            self._traj_fp.write(_encode_json(step) + b"\n")
+            self._traj_fp.flush()
+        except Exception as e:
+            logger.error(f"Failed to append trajectory step: {e}")
+    
+    def _finalize_trajectory(self, result: ExecutionResult) -> None:
+        """Stop the prefetch worker, close trajectory.jsonl and write summary.json."""
+        self._discard_pending_shot()
+        if self._screenshot_pool is not None:
+            self._screenshot_pool.shutdown(wait=True)
+            self._screenshot_pool = None
+        
+        if self._traj_fp is not None:
+            self._traj_fp.close()
+            self._traj_fp = None
+        
         if not self.config.logging.save_trajectory:
             return
         
         try:
             # Create log directory
-            log_dir = Path(self.config.logging.output_dir) / self.task_id
+            log_dir = self._task_log_dir()
             log_dir.mkdir(parents=True, exist_ok=True)
             
-            # Convert result to dict
-            result_dict = {
+            summary = {
                 "task_id": result.task_id,
                 "instruction": result.instruction,
+                "started_at": result.started_at,
                 "status": result.status,
                 "total_steps": result.total_steps,
                 "duration_seconds": result.duration_seconds,
                 "final_message": result.final_message,
                 "error": result.error,
-                "trajectory": [asdict(step) for step in result.trajectory],
             }
             
-            # Save to JSON
-            trajectory_file = log_dir / "trajectory.json"
-            with open(trajectory_file, "w", encoding="utf-8") as f:
-                json.dump(result_dict, f, indent=2, ensure_ascii=False)
+            summary_file = log_dir / SUMMARY_FILE
+            with open(summary_file, "wb") as f:
+                f.write(_encode_json(summary, indent=True))
             
-            logger.info(f"Saved trajectory to: {trajectory_file}")
+            logger.info(f"Saved trajectory to: {log_dir}")
             
         except Exception as e:
-            logger.error(f"Failed to save trajectory: {e}")
+            logger.error(f"Failed to save trajectory summary: {e}")
+
+
+def load_trajectory(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load a saved task log for replay or analysis.
+    
+    Args:
+        path: Task log directory, its summary.json / trajectory.jsonl, or a
+            legacy single-file trajectory.json.
+            
+    Returns:
+        Summary fields plus a "trajectory" list with one dict per step.
+    """
+    path = Path(path)
+    if path.is_file() and path.suffix == ".json" and path.name != SUMMARY_FILE:
+        # Legacy format: summary and steps in one document
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    log_dir = path if path.is_dir() else path.parent
+    
+    data: Dict[str, Any] = {}
+    summary_file = log_dir / SUMMARY_FILE
+    if summary_file.exists():
+        with open(summary_file, "r", encoding="utf-8") as f:
+            data.update(json.load(f))
+    
+    steps = []
+    steps_file = log_dir / TRAJECTORY_FILE
+    if steps_file.exists():
+        with open(steps_file, "r", encoding="utf-8") as f:
+            steps = [json.loads(line) for line in f if line.strip()]
+    data["trajectory"] = steps
+    return data
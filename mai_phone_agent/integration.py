@@ -18,9 +18,10 @@ handling observation formatting, action parsing, and coordinate transformation.
 """
 
 import logging
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 from PIL import Image
 
+from mai_phone_agent.coord_kernel import denormalize_batch, warmup
 from mai_phone_agent.device_bridge import DeviceBridge
 from mai_phone_agent.utils import (
     parse_tagged_text,
@@ -84,6 +85,9 @@ class AgentIntegration:
         self.screen_width = device_bridge.screen_width
         self.screen_height = device_bridge.screen_height
         
+        # Compile the batch kernel now rather than on the first swipe
+        warmup()
+        
         logger.info(
             f"Initialized AgentIntegration with screen size: "
             f"{self.screen_width}x{self.screen_height}"
@@ -172,10 +176,9 @@ class AgentIntegration:
             transformed_action["coordinate"] = self._transform_coordinate(coord)
         
         elif action_type == "swipe":
-            start = action["start"]
-            end = action["end"]
-            transformed_action["start"] = self._transform_coordinate(start)
-            transformed_action["end"] = self._transform_coordinate(end)
+            start, end = self._transform_coordinates([action["start"], action["end"]])
+            transformed_action["start"] = start
+            transformed_action["end"] = end
         
         elif action_type == "long_press":
             coord = action["coordinate"]
@@ -214,6 +217,28 @@ class AgentIntegration:
         
         return (pixel_x, pixel_y)
     
+    def _transform_coordinates(self, normalized_coords: List[list]) -> List[Tuple[int, int]]:
+        """
+        Transform several normalized [0, 1] coordinates to pixels in one batch.
+        
+        Args:
+            normalized_coords: List of [x, y] points in range [0, 1].
+            
+        Returns:
+            List of (pixel_x, pixel_y) tuples.
+            
+        Raises:
+            ActionValidationError: If any coordinate is out of range.
+        """
+        for x_norm, y_norm in normalized_coords:
+            if not (0 <= x_norm <= 1 and 0 <= y_norm <= 1):
+                raise ActionValidationError(
+                    f"Coordinates must be in [0, 1] range. Got: [{x_norm}, {y_norm}]"
+                )
+        
+        pixels = denormalize_batch(normalized_coords, (self.screen_width, self.screen_height))
+        return [(int(x), int(y)) for x, y in pixels]
+    
     def execute_action(self, action: Dict[str, Any]) -> None:
         """
         Execute action on device.
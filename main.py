@@ -13,7 +13,10 @@ import argparse
 import logging
 import sys
 import os
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Dict
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -55,6 +58,237 @@ def load_app_mapping(config_path="app_mapping.yaml"):
     return mapping
 
 
+@dataclass
+class RunState:
+    """Mutable state shared by action handlers across steps."""
+    app_mapping: Dict[str, str]
+    memory: Dict[str, Any] = field(default_factory=dict)  # Persistent memory for the agent
+
+
+# Action handlers: each returns True when the task is finished.
+
+def handle_terminate(device, action_dict, state):
+    status = action_dict.get("status", "success")
+    print(f"✅ Task {status}!")
+    return True
+
+
+def handle_open(device, action_dict, state):
+    app_name = action_dict.get("text", "")
+    print(f"  Opening app: {app_name}")
+    
+    # 1. Try loaded mapping
+    package_name = state.app_mapping.get(app_name.lower())
+    
+    if not package_name:
+        # Fallback 1: Try straightforward patterns
+        candidates = [
+            f"com.android.{app_name.lower()}",
+            f"com.google.android.{app_name.lower()}"
+        ]
+        
+        # Fallback 2: Search installed packages
+        try:
+            installed_packages = device._packages()
+            
+            # Search for app_name in package names
+            matches = [p for p in installed_packages if app_name.lower() in p.lower()]
+            if matches:
+                matches.sort(key=len)
+                package_name = matches[0]
+                print(f"  (Found package via search: {package_name})")
+            else:
+                package_name = candidates[0]
+        except Exception as e:
+            print(f"  Warning: Package search failed ({e}), using default pattern.")
+            package_name = candidates[0]
+
+    # Try to launch the app
+    try:
+        # Method 1: am start on the resolved launcher activity (falls back to monkey)
+        device.launch_app(package_name)
+    except Exception as e:
+        # Method 2: Specific handling for Settings (am start)
+        if package_name == "com.android.settings":
+            try:
+                print(f"  (Monkey failed, trying 'am start' for Settings)")
+                device._adb_command("shell", "am", "start", "-a", "android.settings.SETTINGS")
+                return False # Success
+            except:
+                pass
+                
+        print(f"  Warning: Could not launch {app_name} ({package_name}): {e}")
+    return False
+
+
+def handle_click(device, action_dict, state):
+    coord = action_dict["coordinate"]
+    # MAI-UI agent already normalizes coordinates to [0, 1] range
+    x = int(coord[0] * device.screen_width)
+    y = int(coord[1] * device.screen_height)
+    print(f"  Tap at ({x}, {y}) - normalized: [{coord[0]:.3f}, {coord[1]:.3f}]")
+    device.tap(x, y)
+    return False
+
+
+def handle_swipe(device, action_dict, state):
+    # Swipe has two formats:
+    # 1. Direction-based: {"action": "swipe", "direction": "up/down/left/right", "coordinate": [x, y]}
+    # 2. Coordinate-based: {"action": "swipe", "start": [x1, y1], "end": [x2, y2]}
+    
+    if "direction" in action_dict:
+        # Direction-based swipe
+        direction = action_dict["direction"]
+        coord = action_dict.get("coordinate", [0.5, 0.5])  # Default to center
+        
+        # Convert coordinate to pixels
+        center_x = int(coord[0] * device.screen_width)
+        center_y = int(coord[1] * device.screen_height)
+        
+        # Calculate swipe start and end based on direction
+        # Increase distance to 1/2 screen to ensure scroll/drawer open works
+        swipe_distance = min(device.screen_width, device.screen_height) // 2
+        
+        if direction == "up":
+            x1, y1 = center_x, center_y + swipe_distance // 2
+            x2, y2 = center_x, center_y - swipe_distance // 2
+        elif direction == "down":
+            x1, y1 = center_x, center_y - swipe_distance // 2
+            x2, y2 = center_x, center_y + swipe_distance // 2
+        elif direction == "left":
+            x1, y1 = center_x + swipe_distance // 2, center_y
+            x2, y2 = center_x - swipe_distance // 2, center_y
+        elif direction == "right":
+            x1, y1 = center_x - swipe_distance // 2, center_y
+            x2, y2 = center_x + swipe_distance // 2, center_y
+        else:
+            print(f"  Unknown swipe direction: {direction}")
+            return False
+        
+        print(f"  Swipe {direction} from ({x1}, {y1}) to ({x2}, {y2})")
+        device.swipe(x1, y1, x2, y2)
+        
+    elif "start" in action_dict and "end" in action_dict:
+        # Coordinate-based swipe
+        start = action_dict["start"]
+        end = action_dict["end"]
+        # MAI-UI agent already normalizes coordinates to [0, 1] range
+        x1 = int(start[0] * device.screen_width)
+        y1 = int(start[1] * device.screen_height)
+        x2 = int(end[0] * device.screen_width)
+        y2 = int(end[1] * device.screen_height)
+        print(f"  Swipe from ({x1}, {y1}) to ({x2}, {y2})")
+        device.swipe(x1, y1, x2, y2)
+    else:
+        print(f"  Invalid swipe action: missing direction or start/end coordinates")
+    return False
+
+
+def handle_type(device, action_dict, state):
+    text = action_dict["text"]
+    print(f"  Type: {text}")
+    success, error_msg = device.type_text(text)
+    
+    # 如果输入失败（如未安装 ADBKeyboard），立即终止任务
+    if not success:
+        print(f"\n❌ Fatal Error: Text input failed!")
+        print(f"   {error_msg}")
+        print(f"\n🛑 Task terminated due to input capability issue.")
+        print(f"   Please install ADBKeyBoard and try again:")
+        print(f"   1. Download: https://github.com/senzhk/ADBKeyBoard")
+        print(f"   2. Install: adb install ADBKeyBoard.apk")
+        print(f"   3. Enable: adb shell ime set com.android.adbkeyboard/.AdbIME\n")
+        return True
+    return False
+
+
+def handle_long_press(device, action_dict, state):
+    coord = action_dict["coordinate"]
+    # Normalization 0-1 -> pixels
+    x = int(coord[0] * device.screen_width)
+    y = int(coord[1] * device.screen_height)
+    print(f"  Long press at ({x}, {y})")
+    device.long_press(x, y)
+    return False
+
+
+def handle_drag(device, action_dict, state):
+    start = action_dict["start_coordinate"]
+    end = action_dict["end_coordinate"]
+    # Normalization 0-1 -> pixels
+    x1 = int(start[0] * device.screen_width)
+    y1 = int(start[1] * device.screen_height)
+    x2 = int(end[0] * device.screen_width)
+    y2 = int(end[1] * device.screen_height)
+    print(f"  Drag from ({x1}, {y1}) to ({x2}, {y2})")
+    # Drag is essentially a slow swipe
+    device.swipe(x1, y1, x2, y2, duration=1000)
+    return False
+
+
+def handle_system_button(device, action_dict, state):
+    button = action_dict.get("button", "back")
+    print(f"  Press {button} button")
+    if button == "back":
+        device.press_back()
+    elif button == "home":
+        device.press_home()
+    elif button == "menu" or button == "recent":
+        device.press_recent()
+    elif button == "enter":
+        device._adb_command("shell", "input", "keyevent", "66") # KEYCODE_ENTER
+    return False
+
+
+def handle_wait(device, action_dict, state):
+    # Support custom duration
+    duration = action_dict.get("seconds") or action_dict.get("duration") or 2.0
+    try:
+        duration = float(duration)
+    except:
+        duration = 2.0
+        
+    print(f"  Waiting for {duration:.1f} seconds...")
+    time.sleep(duration)
+    return False
+
+
+def handle_memo(device, action_dict, state):
+    key = action_dict.get("key")
+    value = action_dict.get("value")
+    if key:
+        state.memory[key] = value
+        print(f"  📝 Memo: Updated '{key}' to {value}")
+    return False
+
+
+def handle_answer(device, action_dict, state):
+    text = action_dict.get("text", "")
+    print(f"  Agent answer: {text}")
+    # Answer usually means task is complete
+    return True
+
+
+def handle_unknown(device, action_dict, state):
+    print(f"  Unknown action: {action_dict.get('action', 'unknown')}")
+    return False
+
+
+ACTION_HANDLERS = {
+    "terminate": handle_terminate,
+    "open": handle_open,
+    "click": handle_click,
+    "swipe": handle_swipe,
+    "type": handle_type,
+    "long_press": handle_long_press,
+    "drag": handle_drag,
+    "system_button": handle_system_button,
+    "wait": handle_wait,
+    "memo": handle_memo,
+    "answer": handle_answer,
+}
+
+
 def main():
     parser = argparse.ArgumentParser(description="MAI Phone Agent - Autonomous Android Control")
     parser.add_argument("instruction", help="Task instruction in natural language")
@@ -106,9 +340,8 @@ def main():
         
         step = 0
         done = False
-        import time
         start_time = time.time()
-        agent_memory = {} # Persistent memory for the agent
+        state = RunState(app_mapping=app_mapping)
         
         while not done and step < args.max_steps:
             step += 1
@@ -121,8 +354,8 @@ def main():
             
             # Get prediction with context
             context_str = f"Current Step: {step}, Time Elapsed: {elapsed_time:.1f}s"
-            if agent_memory:
-                context_str += f", Memory: {agent_memory}"
+            if state.memory:
+                context_str += f", Memory: {state.memory}"
             
             prediction_text, action_dict = agent.predict(args.instruction, obs, extra_info=context_str)
             
@@ -144,203 +377,15 @@ def main():
                 if is_loop:
                     print(f"\n⚠️  Loop Detected: Repeated action '{action_type}' 3 times.")
                     print(f"   forcing a wait to break potential race conditions...")
-                    import time
                     time.sleep(2)
                     # We could also choose to terminate or inject a 'back' button here
             
-            if action_type == "terminate":
-                status = action_dict.get("status", "success")
-                done = True
-                print(f"✅ Task {status}!")
+            handler = ACTION_HANDLERS.get(action_type, handle_unknown)
+            done = handler(device, action_dict, state)
+            if done:
                 break
             
-            elif action_type == "open":
-                app_name = action_dict.get("text", "")
-                print(f"  Opening app: {app_name}")
-                
-                # 1. Try loaded mapping
-                package_name = app_mapping.get(app_name.lower())
-                
-                if not package_name:
-                    # Fallback 1: Try straightforward patterns
-                    candidates = [
-                        f"com.android.{app_name.lower()}",
-                        f"com.google.android.{app_name.lower()}"
-                    ]
-                    
-                    # Fallback 2: Search installed packages
-                    try:
-                        output = device._adb_command("shell", "pm", "list", "packages")
-                        # output format: package:com.example.app
-                        installed_packages = [line.replace("package:", "").strip() for line in output.splitlines()]
-                        
-                        # Search for app_name in package names
-                        matches = [p for p in installed_packages if app_name.lower() in p.lower()]
-                        if matches:
-                            matches.sort(key=len)
-                            package_name = matches[0]
-                            print(f"  (Found package via search: {package_name})")
-                        else:
-                            package_name = candidates[0]
-                    except Exception as e:
-                        print(f"  Warning: Package search failed ({e}), using default pattern.")
-                        package_name = candidates[0]
-
-                # Try to launch the app
-                try:
-                    # Method 1: Monkey with LAUNCHER category (more stable)
-                    device._adb_command("shell", "monkey", "-p", package_name, "-c", "android.intent.category.LAUNCHER", "1")
-                except Exception as e:
-                    # Method 2: Specific handling for Settings (am start)
-                    if package_name == "com.android.settings":
-                        try:
-                            print(f"  (Monkey failed, trying 'am start' for Settings)")
-                            device._adb_command("shell", "am", "start", "-a", "android.settings.SETTINGS")
-                            continue # Success
-                        except:
-                            pass
-                            
-                    print(f"  Warning: Could not launch {app_name} ({package_name}): {e}")
-            
-            elif action_type == "click":
-                coord = action_dict["coordinate"]
-                # MAI-UI agent already normalizes coordinates to [0, 1] range
-                x = int(coord[0] * device.screen_width)
-                y = int(coord[1] * device.screen_height)
-                print(f"  Tap at ({x}, {y}) - normalized: [{coord[0]:.3f}, {coord[1]:.3f}]")
-                device.tap(x, y)
-            
-            elif action_type == "swipe":
-                # Swipe has two formats:
-                # 1. Direction-based: {"action": "swipe", "direction": "up/down/left/right", "coordinate": [x, y]}
-                # 2. Coordinate-based: {"action": "swipe", "start": [x1, y1], "end": [x2, y2]}
-                
-                if "direction" in action_dict:
-                    # Direction-based swipe
-                    direction = action_dict["direction"]
-                    coord = action_dict.get("coordinate", [0.5, 0.5])  # Default to center
-                    
-                    # Convert coordinate to pixels
-                    center_x = int(coord[0] * device.screen_width)
-                    center_y = int(coord[1] * device.screen_height)
-                    
-                    # Calculate swipe start and end based on direction
-                    # Increase distance to 1/2 screen to ensure scroll/drawer open works
-                    swipe_distance = min(device.screen_width, device.screen_height) // 2
-                    
-                    if direction == "up":
-                        x1, y1 = center_x, center_y + swipe_distance // 2
-                        x2, y2 = center_x, center_y - swipe_distance // 2
-                    elif direction == "down":
-                        x1, y1 = center_x, center_y - swipe_distance // 2
-                        x2, y2 = center_x, center_y + swipe_distance // 2
-                    elif direction == "left":
-                        x1, y1 = center_x + swipe_distance // 2, center_y
-                        x2, y2 = center_x - swipe_distance // 2, center_y
-                    elif direction == "right":
-                        x1, y1 = center_x - swipe_distance // 2, center_y
-                        x2, y2 = center_x + swipe_distance // 2, center_y
-                    else:
-                        print(f"  Unknown swipe direction: {direction}")
-                        continue
-                    
-                    print(f"  Swipe {direction} from ({x1}, {y1}) to ({x2}, {y2})")
-                    device.swipe(x1, y1, x2, y2)
-                    
-                elif "start" in action_dict and "end" in action_dict:
-                    # Coordinate-based swipe
-                    start = action_dict["start"]
-                    end = action_dict["end"]
-                    # MAI-UI agent already normalizes coordinates to [0, 1] range
-                    x1 = int(start[0] * device.screen_width)
-                    y1 = int(start[1] * device.screen_height)
-                    x2 = int(end[0] * device.screen_width)
-                    y2 = int(end[1] * device.screen_height)
-                    print(f"  Swipe from ({x1}, {y1}) to ({x2}, {y2})")
-                    device.swipe(x1, y1, x2, y2)
-                else:
-                    print(f"  Invalid swipe action: missing direction or start/end coordinates")
-
-            
-            elif action_type == "type":
-                text = action_dict["text"]
-                print(f"  Type: {text}")
-                success, error_msg = device.type_text(text)
-                
-                # 如果输入失败（如未安装 ADBKeyboard），立即终止任务
-                if not success:
-                    print(f"\n❌ Fatal Error: Text input failed!")
-                    print(f"   {error_msg}")
-                    print(f"\n🛑 Task terminated due to input capability issue.")
-                    print(f"   Please install ADBKeyBoard and try again:")
-                    print(f"   1. Download: https://github.com/senzhk/ADBKeyBoard")
-                    print(f"   2. Install: adb install ADBKeyBoard.apk")
-                    print(f"   3. Enable: adb shell ime set com.android.adbkeyboard/.AdbIME\n")
-                    done = True
-                    break
-            
-            elif action_type == "long_press":
-                coord = action_dict["coordinate"]
-                # Normalization 0-1 -> pixels
-                x = int(coord[0] * device.screen_width)
-                y = int(coord[1] * device.screen_height)
-                print(f"  Long press at ({x}, {y})")
-                device.long_press(x, y)
-
-            elif action_type == "drag":
-                start = action_dict["start_coordinate"]
-                end = action_dict["end_coordinate"]
-                # Normalization 0-1 -> pixels
-                x1 = int(start[0] * device.screen_width)
-                y1 = int(start[1] * device.screen_height)
-                x2 = int(end[0] * device.screen_width)
-                y2 = int(end[1] * device.screen_height)
-                print(f"  Drag from ({x1}, {y1}) to ({x2}, {y2})")
-                # Drag is essentially a slow swipe
-                device.swipe(x1, y1, x2, y2, duration=1000)
-
-            elif action_type == "system_button":
-                button = action_dict.get("button", "back")
-                print(f"  Press {button} button")
-                if button == "back":
-                    device.press_back()
-                elif button == "home":
-                    device.press_home()
-                elif button == "menu" or button == "recent":
-                    device.press_recent()
-                elif button == "enter":
-                    device._adb_command("shell", "input", "keyevent", "66") # KEYCODE_ENTER
-            
-            elif action_type == "wait":
-                # Support custom duration
-                duration = action_dict.get("seconds") or action_dict.get("duration") or 2.0
-                try:
-                    duration = float(duration)
-                except:
-                    duration = 2.0
-                    
-                print(f"  Waiting for {duration:.1f} seconds...")
-                import time
-                time.sleep(duration)
-            
-            elif action_type == "memo":
-                key = action_dict.get("key")
-                value = action_dict.get("value")
-                if key:
-                    agent_memory[key] = value
-                    print(f"  📝 Memo: Updated '{key}' to {value}")
-                
-            elif action_type == "answer":
-                text = action_dict.get("text", "")
-                print(f"  Agent answer: {text}")
-                # Answer usually means task is complete
-                done = True
-            
-            else:
-                print(f"  Unknown action: {action_type}")
-            
             # Wait between actions
-            import time
             time.sleep(0.5)
         
         if not done:
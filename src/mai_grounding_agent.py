@@ -27,7 +27,7 @@ from openai import OpenAI
 from PIL import Image
 
 from prompt import MAI_MOBILE_SYS_PROMPT_GROUNDING
-from utils import pil_to_base64, safe_pil_to_bytes
+from utils import get_http_client, pil_to_data_url, safe_pil_to_bytes
 
 
 # Constants
@@ -117,6 +117,8 @@ class MAIGroundingAgent:
                 - top_k: Top-k sampling parameter (default: -1)
                 - top_p: Top-p sampling parameter (default: 1.0)
                 - max_tokens: Maximum tokens in response (default: 2048)
+                - image_format: Upload encoding for screenshots (default: "JPEG")
+                - image_quality: Lossy encoder quality (default: 85)
         """
         # Set default configuration
         default_conf = {
@@ -124,6 +126,8 @@ class MAIGroundingAgent:
             "top_k": -1,
             "top_p": 1.0,
             "max_tokens": 2048,
+            "image_format": "JPEG",
+            "image_quality": 85,
         }
         self.runtime_conf = {**default_conf, **(runtime_conf or {})}
 
@@ -132,6 +136,7 @@ class MAIGroundingAgent:
         self.llm = OpenAI(
             base_url=self.llm_base_url,
             api_key="empty",
+            http_client=get_http_client(),
         )
 
         # Extract frequently used config values
@@ -139,6 +144,8 @@ class MAIGroundingAgent:
         self.top_k = self.runtime_conf["top_k"]
         self.top_p = self.runtime_conf["top_p"]
         self.max_tokens = self.runtime_conf["max_tokens"]
+        self.image_format = self.runtime_conf["image_format"]
+        self.image_quality = self.runtime_conf["image_quality"]
 
     @property
     def system_prompt(self) -> str:
@@ -161,7 +168,7 @@ class MAIGroundingAgent:
         Returns:
             List of message dictionaries for the API.
         """
-        encoded_string = pil_to_base64(image)
+        image_url = pil_to_data_url(image, format=self.image_format, quality=self.image_quality)
 
         messages = [
             {
@@ -186,7 +193,7 @@ class MAIGroundingAgent:
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{encoded_string}"
+                            "url": image_url
                         },
                     },
                 ],
@@ -21,6 +21,7 @@ to interact with mobile device interfaces based on natural language instructions
 import copy
 import json
 import re
+import sys
 import traceback
 from io import BytesIO
 from typing import Any, Dict, List, Optional, Tuple
@@ -30,9 +31,9 @@ from openai import OpenAI
 from PIL import Image
 
 from base import BaseAgent
-from prompt import MAI_MOBILE_SYS_PROMPT, MAI_MOBILE_SYS_PROMPT_ASK_USER_MCP
+from prompt import get_prompt
 from unified_memory import TrajStep
-from utils import pil_to_base64, safe_pil_to_bytes
+from utils import get_http_client, pil_to_data_url, safe_pil_to_bytes
 
 # Constants
 SCALE_FACTOR = 999
@@ -118,6 +119,7 @@ def parse_action_to_structure_output(text: str) -> Dict[str, Any]:
 
     Note:
         Coordinates are normalized to [0, 1] range by dividing by SCALE_FACTOR.
+        The "action" tag is interned with sys.intern.
     """
     text = text.strip()
 
@@ -126,6 +128,10 @@ def parse_action_to_structure_output(text: str) -> Dict[str, Any]:
     tool_call = results["tool_call"]
     action = tool_call["arguments"]
 
+    # Intern the action tag so downstream dispatch compares by identity
+    if isinstance(action.get("action"), str):
+        action["action"] = sys.intern(action["action"])
+
     # Normalize coordinates from SCALE_FACTOR range to [0, 1]
     if "coordinate" in action:
         coordinates = action["coordinate"]
@@ -188,6 +194,10 @@ class MAIUINaivigationAgent(BaseAgent):
                 - top_k: Top-k sampling parameter (default: -1)
                 - top_p: Top-p sampling parameter (default: 1.0)
                 - max_tokens: Maximum tokens in response (default: 2048)
+                - image_format: Upload encoding for screenshots (default: "JPEG")
+                - image_quality: Lossy encoder quality (default: 85)
+                - max_image_side: Longest side screenshots are downscaled to before
+                  upload (default: 1344, None disables resizing)
             tools: Optional list of MCP tool definitions. Each tool should be a dict
                 with 'name', 'description', and 'parameters' keys.
         """
@@ -203,6 +213,9 @@ class MAIUINaivigationAgent(BaseAgent):
             "top_k": -1,
             "top_p": 1.0,
             "max_tokens": 2048,
+            "image_format": "JPEG",
+            "image_quality": 85,
+            "max_image_side": 1344,
         }
         self.runtime_conf = {**default_conf, **(runtime_conf or {})}
 
@@ -215,6 +228,7 @@ class MAIUINaivigationAgent(BaseAgent):
         self.llm = OpenAI(
             base_url=self.llm_base_url,
             api_key=effective_api_key,
+            http_client=get_http_client(),
         )
 
         # Extract frequently used config values
@@ -223,21 +237,33 @@ class MAIUINaivigationAgent(BaseAgent):
         self.top_p = self.runtime_conf["top_p"]
         self.max_tokens = self.runtime_conf["max_tokens"]
         self.history_n = self.runtime_conf["history_n"]
+        self.image_format = self.runtime_conf["image_format"]
+        self.image_quality = self.runtime_conf["image_quality"]
+        self.max_image_side = self.runtime_conf["max_image_side"]
+
+        # Rendered once so every step sends a byte-identical prefix
+        self._system_prompt = self._render_system_prompt()
+
+    def _render_system_prompt(self) -> str:
+        """
+        Render the system prompt based on available MCP tools.
+
+        Returns:
+            System prompt string, with MCP tools section if tools are configured.
+        """
+        if self.tools:
+            return get_prompt("mcp", self.tools)
+        return get_prompt("thinking")
 
     @property
     def system_prompt(self) -> str:
         """
-        Generate the system prompt based on available MCP tools.
+        Return the system prompt rendered at initialization.
 
         Returns:
             System prompt string, with MCP tools section if tools are configured.
         """
-        if self.tools:
-            tools_str = "\n".join(
-                [json.dumps(tool, ensure_ascii=False) for tool in self.tools]
-            )
-            return MAI_MOBILE_SYS_PROMPT_ASK_USER_MCP.render(tools=tools_str)
-        return MAI_MOBILE_SYS_PROMPT
+        return self._system_prompt
 
     @property
     def history_responses(self) -> List[str]:
@@ -326,10 +352,30 @@ class MAIUINaivigationAgent(BaseAgent):
             if image.mode != "RGB":
                 image = image.convert("RGB")
 
+            # Coordinates are normalized, so only the uploaded copy is resized
+            if self.max_image_side and max(image.size) > self.max_image_side:
+                image = image.copy()
+                image.thumbnail(
+                    (self.max_image_side, self.max_image_side),
+                    Image.Resampling.BILINEAR,
+                )
+
             images.append(image)
 
         return images
 
+    def _image_url(self, image: Image.Image) -> str:
+        """
+        Encode an image as a data URL using the configured upload format.
+
+        Args:
+            image: PIL Image to encode.
+
+        Returns:
+            Data URL suitable for an ``image_url`` message item.
+        """
+        return pil_to_data_url(image, format=self.image_format, quality=self.image_quality)
+
     def _build_messages(
         self,
         instruction: str,
@@ -346,6 +392,12 @@ class MAIUINaivigationAgent(BaseAgent):
 
         Returns:
             List of message dictionaries for the API.
+
+        Note:
+            Message order is always [system, instruction, history..., current
+            screenshot]. Per-step text (step counter, elapsed time, memory) only
+            goes into the final user turn so the leading messages stay identical
+            across steps and hit the server's prefix cache.
         """
         messages = [
             {
@@ -368,12 +420,11 @@ class MAIUINaivigationAgent(BaseAgent):
                     # Add image before the assistant response
                     if image_num < len(images) - 1:
                         cur_image = images[image_num]
-                        encoded_string = pil_to_base64(cur_image)
                         messages.append({
                             "role": "user",
                             "content": [{
                                 "type": "image_url",
-                                "image_url": {"url": f"data:image/png;base64,{encoded_string}"},
+                                "image_url": {"url": self._image_url(cur_image)},
                             }],
                         })
                         image_num += 1
@@ -386,11 +437,10 @@ class MAIUINaivigationAgent(BaseAgent):
             # Add current image (last one in images list)
             if image_num < len(images):
                 cur_image = images[image_num]
-                encoded_string = pil_to_base64(cur_image)
                 
                 content_list = [{
                     "type": "image_url",
-                    "image_url": {"url": f"data:image/png;base64,{encoded_string}"},
+                    "image_url": {"url": self._image_url(cur_image)},
                 }]
                 
                 # Append current context if provided
@@ -404,11 +454,10 @@ class MAIUINaivigationAgent(BaseAgent):
         else:
             # No history, just add the current image
             cur_image = images[0]
-            encoded_string = pil_to_base64(cur_image)
             
             content_list = [{
                 "type": "image_url",
-                "image_url": {"url": f"data:image/png;base64,{encoded_string}"},
+                "image_url": {"url": self._image_url(cur_image)},
             }]
             
             # Append current context if provided
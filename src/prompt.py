@@ -13,17 +13,26 @@
 
 """System prompts for MAI Mobile Agent."""
 
-from datetime import datetime
-from jinja2 import Template
+import json
+import sys
+import time
+from functools import lru_cache
+from typing import Any, Dict, Final, FrozenSet, Optional, Sequence, Union
+
+@lru_cache(maxsize=2)
+def _format_date(year: int, month: int, day: int) -> str:
+    return f"{year}年{month:02d}月{day:02d}日"
 
 # 动态获取当前日期
 def get_formatted_date():
-    today = datetime.today()
-    return today.strftime("%Y年%m月%d日")
+    now = time.localtime()
+    return _format_date(now.tm_year, now.tm_mon, now.tm_mday)
 
-MAI_MOBILE_SYS_PROMPT = """You are a GUI agent. You are given a task and your action history, with screenshots. You need to perform the next action to complete the task.
+# Sections shared by the prompt variants. Each variant is assembled from them
+# once at import time.
+_INTRO = "You are a GUI agent. You are given a task and your action history, with screenshots. You need to perform the next action to complete the task."
 
-## Output Format
+_OUTPUT_FORMAT_THINKING = """## Output Format
 For each function call, return the thinking process in <thinking> </thinking> tags, and a json object with function name and arguments within <tool_call></tool_call> XML tags:
 ```
 <thinking>
@@ -32,24 +41,55 @@ For each function call, return the thinking process in <thinking> </thinking> ta
 <tool_call>
 {"name": "mobile_use", "arguments": <args-json-object>}
 </tool_call>
-```
+```"""
 
-## Action Space
+_OUTPUT_FORMAT_NO_THINKING = """## Output Format
+For each function call, return a json object with function name and arguments within <tool_call></tool_call> XML tags:
+```
+<tool_call>
+{"name": "mobile_use", "arguments": <args-json-object>}
+</tool_call>
+```"""
 
-{"action": "click", "coordinate": [x, y]}
+_ACTIONS_POINTER = """{"action": "click", "coordinate": [x, y]}
 {"action": "long_press", "coordinate": [x, y]}
 {"action": "type", "text": ""}
 {"action": "swipe", "direction": "up or down or left or right", "coordinate": [x, y]} # "coordinate" is optional. Use the "coordinate" if you want to swipe a specific UI element.
 {"action": "open", "text": "app_name"}
-{"action": "drag", "start_coordinate": [x1, y1], "end_coordinate": [x2, y2]}
-{"action": "system_button", "button": "button_name"} # Options: back, home, menu, enter
-{"action": "wait", "duration": 2.0} # Optional duration in seconds (default 2.0)
-{"action": "memo", "key": "attribute", "value": "value"} # Update persistent memory (e.g., counters) to track state across steps
-{"action": "terminate", "status": "success or fail"}
-{"action": "answer", "text": "xxx"} # Use escape characters \\', \\", and \\n in text part to ensure we can parse the text in normal python string format.
+{"action": "drag", "start_coordinate": [x1, y1], "end_coordinate": [x2, y2]}"""
+_ACTION_SYSTEM_BUTTON = '{"action": "system_button", "button": "button_name"} # Options: back, home, menu, enter'
+_ACTION_WAIT = '{"action": "wait", "duration": 2.0} # Optional duration in seconds (default 2.0)'
+_ACTION_MEMO = '{"action": "memo", "key": "attribute", "value": "value"} # Update persistent memory (e.g., counters) to track state across steps'
+_ACTION_TERMINATE = '{"action": "terminate", "status": "success or fail"}'
+_ACTION_ANSWER = """{"action": "answer", "text": "xxx"} # Use escape characters \\', \\", and \\n in text part to ensure we can parse the text in normal python string format."""
+
+_NOTE_PLAN = """- Write a small plan and finally summarize your next action (with its target element) in one sentence in <thinking></thinking> part.
+- In <thinking> tag, when clicking on apps or buttons, explicitly state what text/label you see to confirm it matches user's instruction."""
+
+# Apps listed in the prompts, in prompt order; the frozensets are for lookups
+_AVAILABLE_APPS = (
+    "Camera", "Chrome", "Clock", "Contacts", "Dialer", "Files", "Settings",
+    "Markor", "Tasks", "Simple Draw Pro", "Simple Gallery Pro",
+    "Simple SMS Messenger", "Audio Recorder", "Pro Expense", "Broccoli APP",
+    "OSMand", "VLC", "Joplin", "Retro Music", "OpenTracks",
+    "Simple Calendar Pro",
+)
+_MCP_AVAILABLE_APPS = (
+    "Contacts", "Settings", "Clock", "Maps", "Chrome", "Calendar", "files",
+    "Gallery", "Taodian", "Mattermost", "Mastodon", "Mail", "SMS", "Camera",
+)
+AVAILABLE_APPS: Final[FrozenSet[str]] = frozenset(_AVAILABLE_APPS)
+MCP_AVAILABLE_APPS: Final[FrozenSet[str]] = frozenset(_MCP_AVAILABLE_APPS)
 
+_NOTE_APPS = "\n".join([
+    "- Available Apps: `" + json.dumps(_AVAILABLE_APPS, separators=(",", ":")) + "`.",
+    "You should use the `open` action to open the app as possible as you can, because it is the fast way to open the app.",
+    "- You must follow the Action Space strictly, and return the correct json object within <thinking> </thinking> and <tool_call></tool_call> XML tags.",
+])
 
-## Critical Rules (MUST FOLLOW)
+_NOTE_STEP_CONTEXT = '- You will receive "Current Step" and "Time Elapsed" context with each input. Use this to track time-based tasks (e.g., "watch for 10 seconds").'
+
+_CRITICAL_RULES = """## Critical Rules (MUST FOLLOW)
 
 ### Rule 1: Exact Name Matching
 When user specifies a target name (app name, product name, contact name, etc.), you MUST interact with EXACTLY that target:
@@ -125,99 +165,52 @@ When task requires repeating an action N times (e.g., "watch 10 videos", "scroll
 ### Rule 10: Fail Gracefully
 If unable to complete task after multiple attempts:
 - DO NOT click on a similar but incorrect target as fallback
-- Use answer to clearly explain the problem and what was attempted
-
-
-## Note
-- Write a small plan and finally summarize your next action (with its target element) in one sentence in <thinking></thinking> part.
-- In <thinking> tag, when clicking on apps or buttons, explicitly state what text/label you see to confirm it matches user's instruction.
-- Available Apps: `["Camera","Chrome","Clock","Contacts","Dialer","Files","Settings","Markor","Tasks","Simple Draw Pro","Simple Gallery Pro","Simple SMS Messenger","Audio Recorder","Pro Expense","Broccoli APP","OSMand","VLC","Joplin","Retro Music","OpenTracks","Simple Calendar Pro"]`.
-You should use the `open` action to open the app as possible as you can, because it is the fast way to open the app.
-- You must follow the Action Space strictly, and return the correct json object within <thinking> </thinking> and <tool_call></tool_call> XML tags.
-- You will receive "Current Step" and "Time Elapsed" context with each input. Use this to track time-based tasks (e.g., "watch for 10 seconds").
-""".strip()
-
-
-MAI_MOBILE_SYS_PROMPT_NO_THINKING = """You are a GUI agent. You are given a task and your action history, with screenshots. You need to perform the next action to complete the task.
-
-## Output Format
-For each function call, return a json object with function name and arguments within <tool_call></tool_call> XML tags:
-```
-<tool_call>
-{"name": "mobile_use", "arguments": <args-json-object>}
-</tool_call>
-```
-
-## Action Space
-
-{"action": "click", "coordinate": [x, y]}
-{"action": "long_press", "coordinate": [x, y]}
-{"action": "type", "text": ""}
-{"action": "swipe", "direction": "up or down or left or right", "coordinate": [x, y]} # "coordinate" is optional. Use the "coordinate" if you want to swipe a specific UI element.
-{"action": "open", "text": "app_name"}
-{"action": "drag", "start_coordinate": [x1, y1], "end_coordinate": [x2, y2]}
-{"action": "system_button", "button": "button_name"} # Options: back, home, menu, enter
-{"action": "wait", "duration": 2.0} # Optional duration in seconds (default 2.0)
-{"action": "terminate", "status": "success or fail"}
-{"action": "answer", "text": "xxx"} # Use escape characters \\', \\", and \\n in text part to ensure we can parse the text in normal python string format.
-
-
-## Note
-- Available Apps: `["Camera","Chrome","Clock","Contacts","Dialer","Files","Settings","Markor","Tasks","Simple Draw Pro","Simple Gallery Pro","Simple SMS Messenger","Audio Recorder","Pro Expense","Broccoli APP","OSMand","VLC","Joplin","Retro Music","OpenTracks","Simple Calendar Pro"]`.
-You should use the `open` action to open the app as possible as you can, because it is the fast way to open the app.
-- You must follow the Action Space strictly, and return the correct json object within <thinking> </thinking> and <tool_call></tool_call> XML tags.
-""".strip()
+- Use answer to clearly explain the problem and what was attempted"""
+
+
+MAI_MOBILE_SYS_PROMPT: Final[str] = sys.intern("\n".join([
+    _INTRO,
+    "",
+    _OUTPUT_FORMAT_THINKING,
+    "",
+    "## Action Space",
+    "",
+    _ACTIONS_POINTER,
+    _ACTION_SYSTEM_BUTTON,
+    _ACTION_WAIT,
+    _ACTION_MEMO,
+    _ACTION_TERMINATE,
+    _ACTION_ANSWER,
+    "",
+    _CRITICAL_RULES,
+    "",
+    "## Note",
+    _NOTE_PLAN,
+    _NOTE_APPS,
+    _NOTE_STEP_CONTEXT,
+]))
+
+
+MAI_MOBILE_SYS_PROMPT_NO_THINKING: Final[str] = sys.intern("\n".join([
+    _INTRO,
+    "",
+    _OUTPUT_FORMAT_NO_THINKING,
+    "",
+    "## Action Space",
+    "",
+    _ACTIONS_POINTER,
+    _ACTION_SYSTEM_BUTTON,
+    _ACTION_WAIT,
+    _ACTION_TERMINATE,
+    _ACTION_ANSWER,
+    "",
+    "## Note",
+    _NOTE_APPS,
+]))
 
 
 # MCP 版本的系统提示词（带有 ask_user 和 MCP 工具支持）
-MAI_MOBILE_SYS_PROMPT_ASK_USER_MCP = Template(
-    """You are a GUI agent. You are given a task and your action history, with screenshots. You need to perform the next action to complete the task. 
-
-## Output Format
-For each function call, return the thinking process in <thinking> </thinking> tags, and a json object with function name and arguments within <tool_call></tool_call> XML tags:
-```
-<thinking>
-...
-</thinking>
-<tool_call>
-{"name": "mobile_use", "arguments": <args-json-object>}
-</tool_call>
-```
-
-## Action Space
-
-{"action": "click", "coordinate": [x, y]}
-{"action": "long_press", "coordinate": [x, y]}
-{"action": "type", "text": ""}
-{"action": "swipe", "direction": "up or down or left or right", "coordinate": [x, y]} # "coordinate" is optional. Use the "coordinate" if you want to swipe a specific UI element.
-{"action": "open", "text": "app_name"}
-{"action": "drag", "start_coordinate": [x1, y1], "end_coordinate": [x2, y2]}
-{"action": "system_button", "button": "button_name"} # Options: back, home, menu, enter 
-{"action": "wait", "duration": 2.0} # Optional duration in seconds (default 2.0)
-{"action": "memo", "key": "attribute", "value": "value"} # Update persistent memory (e.g., counters) to track state across steps
-{"action": "terminate", "status": "success or fail"} 
-{"action": "answer", "text": "xxx"} # Use escape characters \\', \\", and \\n in text part to ensure we can parse the text in normal python string format.
-{"action": "ask_user", "text": "xxx"} # you can ask user for more information to complete the task.
-{"action": "double_click", "coordinate": [x, y]}
-
-{% if tools -%}
-## MCP Tools
-You are also provided with MCP tools, you can use them to complete the task.
-{{ tools }}
-
-If you want to use MCP tools, you must output as the following format:
-```
-<thinking>
-...
-</thinking>
-<tool_call>
-{"name": <function-name>, "arguments": <args-json-object>}
-</tool_call>
-```
-{% endif -%}
-
-
-## Critical Rules (MUST FOLLOW)
+_MCP_CRITICAL_RULES = """## Critical Rules (MUST FOLLOW)
 
 ### Rule 1: Exact Name Matching
 When user specifies a target name (app name, product name, contact name, etc.), you MUST interact with EXACTLY that target:
@@ -276,19 +269,72 @@ When task requires repeating an action N times (e.g., "watch 10 videos", "scroll
 
 ### Rule 10: Fail Gracefully
 - DO NOT click on a similar but incorrect target as fallback
-- Use answer to clearly explain the problem
+- Use answer to clearly explain the problem"""
+
+# Prompts contain no per-request values (date, step, task) so that servers with
+# prefix caching reuse the system prompt across turns. Keep it that way: the
+# head below is shared by every MCP render, and the tools block is the only
+# insertion, which is fixed for the lifetime of an agent.
+_MCP_PROMPT_HEAD = "\n".join([
+    _INTRO,
+    "",
+    _OUTPUT_FORMAT_THINKING,
+    "",
+    "## Action Space",
+    "",
+    _ACTIONS_POINTER,
+    _ACTION_SYSTEM_BUTTON,
+    _ACTION_WAIT,
+    _ACTION_MEMO,
+    _ACTION_TERMINATE,
+    _ACTION_ANSWER,
+    '{"action": "ask_user", "text": "xxx"} # you can ask user for more information to complete the task.',
+    '{"action": "double_click", "coordinate": [x, y]}',
+    "",
+    "",
+])
+
+# Wrapped around the tool list and inserted only when MCP tools are configured
+_MCP_TOOLS_HEADER = """## MCP Tools
+You are also provided with MCP tools, you can use them to complete the task.
+"""
 
+_MCP_TOOLS_FOOTER = """
+
+If you want to use MCP tools, you must output as the following format:
+```
+<thinking>
+...
+</thinking>
+<tool_call>
+{"name": <function-name>, "arguments": <args-json-object>}
+</tool_call>
+```
+"""
+
+_MCP_PROMPT_TAIL = "\n".join([
+    _MCP_CRITICAL_RULES,
+    "",
+    "## Note",
+    "- Available Apps: `" + json.dumps(_MCP_AVAILABLE_APPS) + "`.",
+    _NOTE_PLAN,
+    _NOTE_STEP_CONTEXT,
+])
+
+_MCP_PROMPT_NO_TOOLS: Final[str] = sys.intern(_MCP_PROMPT_HEAD + _MCP_PROMPT_TAIL)
+
+
+@lru_cache(maxsize=32)
+def render_mcp_prompt(tools: str) -> str:
+    """Render the MCP system prompt with the given tool descriptions."""
+    if not tools:
+        return _MCP_PROMPT_NO_TOOLS
+    return sys.intern(
+        _MCP_PROMPT_HEAD + _MCP_TOOLS_HEADER + str(tools) + _MCP_TOOLS_FOOTER + _MCP_PROMPT_TAIL
+    )
 
-## Note
-- Available Apps: `["Contacts", "Settings", "Clock", "Maps", "Chrome", "Calendar", "files", "Gallery", "Taodian", "Mattermost", "Mastodon", "Mail", "SMS", "Camera"]`.
-- Write a small plan and finally summarize your next action (with its target element) in one sentence in <thinking></thinking> part.
-- In <thinking> tag, when clicking on apps or buttons, explicitly state what text/label you see to confirm it matches user's instruction.
-- You will receive "Current Step" and "Time Elapsed" context with each input. Use this to track time-based tasks (e.g., "watch for 10 seconds").
-""".strip()
-)
 
-MAI_MOBILE_SYS_PROMPT_GROUNDING = """
-You are a GUI grounding agent. 
+MAI_MOBILE_SYS_PROMPT_GROUNDING: Final[str] = sys.intern("""You are a GUI grounding agent.
 ## Task
 Given a screenshot and the user's grounding instruction. Your task is to accurately locate a UI element based on the user's instructions.
 First, you should carefully examine the screenshot and analyze the user's instructions,  translate the user's instruction into a effective reasoning process, and then provide the final coordinate.
@@ -297,5 +343,74 @@ Return a json object with a reasoning process in <grounding_think></grounding_th
 <grounding_think>...</grounding_think>
 <answer>
 {"coordinate": [x,y]}
-</answer>
-""".strip()
+</answer>""")
+
+# UTF-8 encodings of the fixed prompts for byte-level senders
+MAI_MOBILE_SYS_PROMPT_BYTES: Final[bytes] = MAI_MOBILE_SYS_PROMPT.encode("utf-8")
+MAI_MOBILE_SYS_PROMPT_NO_THINKING_BYTES: Final[bytes] = MAI_MOBILE_SYS_PROMPT_NO_THINKING.encode("utf-8")
+MAI_MOBILE_SYS_PROMPT_GROUNDING_BYTES: Final[bytes] = MAI_MOBILE_SYS_PROMPT_GROUNDING.encode("utf-8")
+
+_PROMPTS = {
+    "thinking": MAI_MOBILE_SYS_PROMPT,
+    "no_thinking": MAI_MOBILE_SYS_PROMPT_NO_THINKING,
+    "grounding": MAI_MOBILE_SYS_PROMPT_GROUNDING,
+}
+
+_PROMPT_BYTES = {
+    "thinking": MAI_MOBILE_SYS_PROMPT_BYTES,
+    "no_thinking": MAI_MOBILE_SYS_PROMPT_NO_THINKING_BYTES,
+    "grounding": MAI_MOBILE_SYS_PROMPT_GROUNDING_BYTES,
+}
+
+
+def serialize_tools(tools: Sequence[Dict[str, Any]]) -> str:
+    """Serialize MCP tool specs to the one-JSON-object-per-line prompt form."""
+    return "\n".join(json.dumps(tool, ensure_ascii=False) for tool in tools)
+
+
+def get_prompt(
+    kind: str, tools: Optional[Union[str, Sequence[Dict[str, Any]]]] = None
+) -> str:
+    """
+    Look up a system prompt by variant.
+
+    Args:
+        kind: One of "thinking", "no_thinking", "grounding" or "mcp".
+        tools: Tool descriptions for the "mcp" variant, either already
+            serialized or as a list of tool spec dicts.
+
+    Returns:
+        The prompt string. MCP renders are cached per serialized tools string.
+    """
+    if kind == "mcp":
+        if tools and not isinstance(tools, str):
+            tools = serialize_tools(tools)
+        return render_mcp_prompt(tools or "")
+    try:
+        return _PROMPTS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown prompt kind: {kind}") from None
+
+
+@lru_cache(maxsize=32)
+def _encode_mcp_prompt(tools: str) -> bytes:
+    return render_mcp_prompt(tools).encode("utf-8")
+
+
+def get_prompt_bytes(
+    kind: str, tools: Optional[Union[str, Sequence[Dict[str, Any]]]] = None
+) -> bytes:
+    """
+    Look up the UTF-8 encoding of a system prompt, see get_prompt().
+
+    Returns:
+        The encoded prompt. Encodings are computed once per variant.
+    """
+    if kind == "mcp":
+        if tools and not isinstance(tools, str):
+            tools = serialize_tools(tools)
+        return _encode_mcp_prompt(tools or "")
+    try:
+        return _PROMPT_BYTES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown prompt kind: {kind}") from None
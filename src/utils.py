@@ -13,13 +13,42 @@
 
 """Utility functions for image processing and conversion."""
 
+import atexit
 import base64
+import importlib.util
+import threading
 from io import BytesIO
 from typing import Union, Optional, Tuple, Dict, Any
 
+import httpx
 from PIL import Image
 from PIL import ImageDraw
 
+# Shared HTTP client so every agent reuses the same keep-alive pool
+_HTTP_CLIENT: Optional[httpx.Client] = None
+
+# Per-thread BytesIO reused for image encoding to avoid per-step allocations
+_ENCODE_BUFFERS = threading.local()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Return the process-wide HTTP client used for LLM API calls.
+
+    The client is created on first use and closed at interpreter exit. HTTP/2
+    is enabled when the optional ``h2`` package is installed. No timeout is
+    set here so the OpenAI SDK keeps its own default request timeout.
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=16),
+        )
+        atexit.register(_HTTP_CLIENT.close)
+    return _HTTP_CLIENT
+
+
 
 def safe_pil_to_bytes(image: Union[Image.Image, bytes]) -> bytes:
     if isinstance(image, Image.Image):
@@ -31,10 +60,29 @@ def safe_pil_to_bytes(image: Union[Image.Image, bytes]) -> bytes:
     else:
         raise TypeError(f"Expected PIL Image or bytes, got {type(image)}")
 
-def pil_to_base64(image: Image.Image) -> str:
-    buffer = BytesIO()
-    image.save(buffer, format="PNG")
-    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+def _encode_buffer() -> BytesIO:
+    """Return this thread's reusable encode buffer, rewound to the start."""
+    buffer = getattr(_ENCODE_BUFFERS, "buffer", None)
+    if buffer is None:
+        buffer = _ENCODE_BUFFERS.buffer = BytesIO()
+    # No truncate: it would shrink the allocation we want to keep
+    buffer.seek(0)
+    return buffer
+
+def pil_to_base64(image: Image.Image, format: str = "PNG", quality: int = 85) -> str:
+    buffer = _encode_buffer()
+    if format.upper() == "PNG":
+        image.save(buffer, format="PNG")
+    else:
+        image.save(buffer, format=format, quality=quality)
+    size = buffer.tell()
+    with buffer.getbuffer() as view:
+        return base64.b64encode(view[:size]).decode("utf-8")
+
+def pil_to_data_url(image: Image.Image, format: str = "JPEG", quality: int = 85) -> str:
+    """Encode an image as a ``data:`` URL for OpenAI-compatible image_url payloads."""
+    encoded_string = pil_to_base64(image, format=format, quality=quality)
+    return f"data:image/{format.lower()};base64,{encoded_string}"
 
 def save_screenshot(screenshot: Image.Image, path: str) -> None:
   screenshot.save(path)
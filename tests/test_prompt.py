@@ -0,0 +1,60 @@
+# Copyright (c) 2025, Alibaba Cloud and its affiliates;
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the system prompts in src/prompt.py."""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import prompt  # noqa: E402
+
+# Prompt text as it was before trailing spaces and triple blank lines were
+# removed; the normalization may only ever have touched whitespace
+BEFORE = json.loads(
+    (ROOT / "tests" / "data" / "prompts_before_whitespace_normalization.json").read_text(
+        encoding="utf-8"
+    )
+)
+TOOLS = '{"name": "search", "description": "Search the web"}'
+
+CURRENT = {
+    "thinking": prompt.MAI_MOBILE_SYS_PROMPT,
+    "no_thinking": prompt.MAI_MOBILE_SYS_PROMPT_NO_THINKING,
+    "grounding": prompt.MAI_MOBILE_SYS_PROMPT_GROUNDING,
+    "mcp": prompt.render_mcp_prompt(""),
+    "mcp_with_tools": prompt.render_mcp_prompt(TOOLS),
+}
+
+
+def _collapse(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+@pytest.mark.parametrize("name", sorted(CURRENT))
+def test_normalization_changed_only_whitespace(name):
+    assert _collapse(CURRENT[name]) == _collapse(BEFORE[name])
+
+
+@pytest.mark.parametrize("name", sorted(CURRENT))
+def test_prompts_have_normalized_whitespace(name):
+    text = CURRENT[name]
+    assert not re.search(r"[ \t]+\n", text)
+    assert "\n\n\n" not in text
+    assert text == text.strip()